@@ -202,6 +202,9 @@ def add_data_sources():
     added = 0
     skipped = 0
 
+    # One timestamp for the whole batch
+    now = datetime.utcnow()
+
     for source_data in NEW_SOURCES:
         # Check if source already exists
         existing = db.query(DataSource).filter(
@@ -227,8 +230,8 @@ def add_data_sources():
             error_count=0,
             last_error=None,
             default_impact_areas=[],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         db.add(source)
@@ -1,9 +1,10 @@
 """Add entities for the new data sources we just added."""
 
-from app.database import SessionLocal
+from app.database import SessionLocal, any_array
 from app.models import Entity
 import uuid
 from datetime import datetime
+from sqlalchemy import String
 
 db = SessionLocal()
 
@@ -33,13 +34,18 @@ def add_entities():
     added = 0
     skipped = 0
 
-    for entity_data in NEW_ENTITIES:
-        # Check if entity already exists
-        existing = db.query(Entity).filter(
-            Entity.name == entity_data['name']
-        ).first()
+    # Check existence for every name in one query rather than one per entity;
+    # = ANY(:names) binds a single text[] parameter however long the list gets
+    names = [e['name'] for e in NEW_ENTITIES]
+    existing_names = {
+        r[0] for r in db.query(Entity.name).filter(Entity.name == any_array(names, String)).all()
+    }
+
+    # One timestamp for the whole batch
+    now = datetime.utcnow()
 
-        if existing:
+    for entity_data in NEW_ENTITIES:
+        if entity_data['name'] in existing_names:
             print(f"⊘ Skipped: {entity_data['name']} (already exists)")
             skipped += 1
             continue
@@ -52,8 +58,8 @@ def add_entities():
             aliases=entity_data['aliases'],
             entity_metadata=None,
             notes=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
 
         db.add(entity)
@@ -1,9 +1,11 @@
 """RSS feed collector for automated signal ingestion."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
+import aiohttp
 import feedparser
 from dateutil import parser as date_parser
 from sqlalchemy.orm import Session
@@ -14,6 +16,22 @@ from app.models import DataSource
 
 logger = logging.getLogger(__name__)
 
+# Feed fetch retries (exponential backoff: 1s, 2s, ...)
+FETCH_RETRIES = 3
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Whether a failed fetch is worth retrying.
+
+    Connection errors, timeouts, 5xx and 429 responses are; other HTTP errors
+    (404, 403, 410 from a dead or moved feed) fail immediately.
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status == 429
+    return True
+
 
 class RSSCollector(BaseCollector):
     """
@@ -23,16 +41,19 @@ class RSSCollector(BaseCollector):
     extracting signals with automatic classification.
     """
 
-    def __init__(self, data_source: DataSource, db: Session):
+    def __init__(self, data_source: DataSource, db: Session, http_session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize RSS collector.
 
         Args:
             data_source: DataSource model instance with RSS feed URL
             db: Database session
+            http_session: Optional shared aiohttp session (reuses its connection
+                pool when collecting several feeds concurrently)
         """
         super().__init__(data_source, db)
         self.feed_url = data_source.url
+        self.http_session = http_session
 
         if not self.feed_url:
             raise ValueError(f"DataSource {data_source.name} has no URL configured")
@@ -49,8 +70,9 @@ class RSSCollector(BaseCollector):
         try:
             logger.info(f"Fetching RSS feed: {self.feed_url}")
 
-            # Parse the feed
-            feed = feedparser.parse(self.feed_url)
+            # Fetch without blocking the event loop, then parse the payload
+            content = await self._fetch_feed()
+            feed = feedparser.parse(content)
 
             # Check for errors
             if feed.bozo:
@@ -84,6 +106,37 @@ class RSSCollector(BaseCollector):
 
         return signals
 
+    async def _fetch_feed(self) -> bytes:
+        """
+        Download the raw feed, retrying transient failures with exponential backoff.
+
+        Returns:
+            Feed body as bytes
+        """
+        if self.http_session is not None:
+            return await self._fetch_with_retries(self.http_session)
+
+        async with aiohttp.ClientSession() as session:
+            return await self._fetch_with_retries(session)
+
+    async def _fetch_with_retries(self, session: aiohttp.ClientSession) -> bytes:
+        """Fetch the feed URL with the given session (see _fetch_feed)."""
+        for attempt in range(FETCH_RETRIES):
+            try:
+                async with session.get(
+                    self.feed_url,
+                    headers={'User-Agent': 'Mozilla/5.0 (STM Intelligence Bot)'},
+                    timeout=FETCH_TIMEOUT,
+                ) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == FETCH_RETRIES - 1 or not _is_transient(e):
+                    raise
+                delay = 2 ** attempt
+                logger.warning(f"Fetching {self.feed_url} failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+
     def _process_entry(self, entry) -> Optional[Dict]:
         """
         Process a single feed entry into a signal.
@@ -1,6 +1,7 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import any_, cast, create_engine
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import get_settings
@@ -32,3 +33,13 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def any_array(values, item_type=UUID(as_uuid=True)):
+    """
+    Bind a list as one array parameter for "column = ANY(...)" filters.
+
+    Unlike IN, the statement text (and plan) stays the same whatever the list
+    length. Elements are UUIDs by default; pass e.g. String for names.
+    """
+    return any_(cast(list(values), ARRAY(item_type)))
@@ -8,8 +8,9 @@ Implements rule-based and LLM-as-judge evaluations for:
 - Coherence and clarity
 """
 
+import threading
 import uuid
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from sqlalchemy.orm import Session
 from app.models import Signal, Theme, WeeklyBrief, EvaluationRun, EvaluationIssue
 from app.config import get_settings
@@ -25,6 +26,7 @@ def check_hallucinations(
     db: Session,
     content_type: str,
     content_data: Dict[str, Any],
+    signals_by_id: Optional[Dict[uuid.UUID, Signal]] = None,
 ) -> Tuple[float, List[Dict]]:
     """
     Run comprehensive hallucination checks on AI-generated content.
@@ -38,6 +40,7 @@ def check_hallucinations(
         db: Database session
         content_type: Type of content ('theme', 'weekly_brief', 'signal_summary')
         content_data: The content to evaluate (includes signal_ids, entities, insights)
+        signals_by_id: Optional prefetched source signals (see _load_source_signals)
 
     Returns:
         Tuple of (hallucination_score 0-10, list of issues found)
@@ -48,9 +51,12 @@ def check_hallucinations(
     # Extract signal IDs from content based on type
     signal_ids = _extract_signal_ids(content_type, content_data)
 
+    if signals_by_id is None:
+        signals_by_id = _load_source_signals(db, signal_ids)
+
     # Check 1: Verify all signal IDs exist in database
     if signal_ids:
-        missing_ids = _check_signal_ids_exist(db, signal_ids)
+        missing_ids = _check_signal_ids_exist(signals_by_id, signal_ids)
         if missing_ids:
             issues.append({
                 'type': 'hallucination',
@@ -63,7 +69,7 @@ def check_hallucinations(
     # Check 2: Verify all mentioned entities exist in source signals
     entities = _extract_entities(content_type, content_data)
     if entities and signal_ids:
-        fabricated_entities = _check_entities_in_signals(db, signal_ids, entities)
+        fabricated_entities = _check_entities_in_signals(signals_by_id, entities)
         if fabricated_entities:
             issues.append({
                 'type': 'hallucination',
@@ -142,40 +148,32 @@ def _extract_entities(content_type: str, content_data: Dict) -> List[str]:
     return list(entities)
 
 
-def _check_signal_ids_exist(db: Session, signal_ids: List[uuid.UUID]) -> List[uuid.UUID]:
-    """Check which signal IDs don't exist in database."""
-    # Query database for these signal IDs
-    existing_ids = db.query(Signal.id).filter(
+def _load_source_signals(db: Session, signal_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Signal]:
+    """Load all non-deleted source signals for the given IDs in one query."""
+    if not signal_ids:
+        return {}
+
+    signals = db.query(Signal).filter(
         Signal.id.in_(signal_ids),
         Signal.deleted_at.is_(None)
     ).all()
-    existing_ids_set = {row[0] for row in existing_ids}
+    return {signal.id: signal for signal in signals}
+
 
-    # Find missing IDs
-    missing = [sid for sid in signal_ids if sid not in existing_ids_set]
+def _check_signal_ids_exist(signals_by_id: Dict[uuid.UUID, Signal], signal_ids: List[uuid.UUID]) -> List[uuid.UUID]:
+    """Check which signal IDs don't exist in database."""
+    missing = [sid for sid in signal_ids if sid not in signals_by_id]
     return missing
 
 
-def _check_entities_in_signals(db: Session, signal_ids: List[uuid.UUID], entities: List[str]) -> List[str]:
+def _check_entities_in_signals(signals_by_id: Dict[uuid.UUID, Signal], entities: List[str]) -> List[str]:
     """Check which entities aren't found in the source signals."""
-    # Get all entities mentioned in source signals
-    signals = db.query(Signal.entity).filter(
-        Signal.id.in_(signal_ids),
-        Signal.deleted_at.is_(None)
-    ).all()
-
-    signal_entities = {row[0] for row in signals}
-
-    # Also check entity_tags if present
-    signals_with_tags = db.query(Signal.entity_tags).filter(
-        Signal.id.in_(signal_ids),
-        Signal.deleted_at.is_(None),
-        Signal.entity_tags.isnot(None)
-    ).all()
-
-    for row in signals_with_tags:
-        if row[0]:  # entity_tags array
-            signal_entities.update(row[0])
+    # Get all entities mentioned in source signals, including entity_tags
+    signal_entities = set()
+    for signal in signals_by_id.values():
+        signal_entities.add(signal.entity)
+        if signal.entity_tags:
+            signal_entities.update(signal.entity_tags)
 
     # Find entities not in source signals
     fabricated = [entity for entity in entities if entity not in signal_entities]
@@ -186,10 +184,63 @@ def _check_entities_in_signals(db: Session, signal_ids: List[uuid.UUID], entitie
 # LLM-as-Judge Quality Scoring
 # ============================================================================
 
+EVALUATOR_MODEL = "gpt-4o-mini"
+
+# Structured output schema for the LLM judge (constant across evaluations)
+EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "evaluation_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "grounding_score": {"type": "number"},
+                "relevance_score": {"type": "number"},
+                "actionability_score": {"type": "number"},
+                "coherence_score": {"type": "number"},
+                "issues": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {"type": "string"},
+                            "severity": {"type": "string"},
+                            "description": {"type": "string"}
+                        },
+                        "required": ["type", "severity", "description"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["grounding_score", "relevance_score", "actionability_score", "coherence_score", "issues"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Shared OpenAI client, reused across evaluations; the lock ensures concurrent
+# first callers (e.g. evaluate_brief's worker threads) build only one
+_evaluator_client = None
+_evaluator_client_lock = threading.Lock()
+
+
+def get_evaluator_client() -> openai.OpenAI:
+    """Get or create the shared OpenAI client used by the LLM judge."""
+    global _evaluator_client
+    if _evaluator_client is None:
+        with _evaluator_client_lock:
+            if _evaluator_client is None:
+                settings = get_settings()
+                _evaluator_client = openai.OpenAI(api_key=settings.openai_api_key)
+    return _evaluator_client
+
+
 def evaluate_with_llm(
     db: Session,
     content_type: str,
     content_data: Dict[str, Any],
+    signals_by_id: Optional[Dict[uuid.UUID, Signal]] = None,
 ) -> Tuple[Dict[str, float], List[Dict]]:
     """
     Use GPT-4o-mini as a judge to evaluate content quality.
@@ -205,20 +256,18 @@ def evaluate_with_llm(
     """
     # Get source signals for context
     signal_ids = _extract_signal_ids(content_type, content_data)
-    signals = db.query(Signal).filter(
-        Signal.id.in_(signal_ids),
-        Signal.deleted_at.is_(None)
-    ).all()
+    if signals_by_id is None:
+        signals_by_id = _load_source_signals(db, signal_ids)
+    signals = [signals_by_id[sid] for sid in dict.fromkeys(signal_ids) if sid in signals_by_id]
 
     # Build prompt for LLM judge
     prompt = _build_evaluation_prompt(content_type, content_data, signals)
 
     try:
         # Call OpenAI with structured output
-        settings = get_settings()
-        client = openai.OpenAI(api_key=settings.openai_api_key)
+        client = get_evaluator_client()
         response = client.chat.completions.create(
-            model="gpt-4o-mini",
+            model=EVALUATOR_MODEL,
             messages=[
                 {
                     "role": "system",
@@ -226,37 +275,7 @@ def evaluate_with_llm(
                 },
                 {"role": "user", "content": prompt}
             ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                    "name": "evaluation_result",
-                    "strict": True,
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "grounding_score": {"type": "number"},
-                            "relevance_score": {"type": "number"},
-                            "actionability_score": {"type": "number"},
-                            "coherence_score": {"type": "number"},
-                            "issues": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "type": {"type": "string"},
-                                        "severity": {"type": "string"},
-                                        "description": {"type": "string"}
-                                    },
-                                    "required": ["type", "severity", "description"],
-                                    "additionalProperties": False
-                                }
-                            }
-                        },
-                        "required": ["grounding_score", "relevance_score", "actionability_score", "coherence_score", "issues"],
-                        "additionalProperties": False
-                    }
-                }
-            },
+            response_format=EVALUATION_RESPONSE_FORMAT,
             temperature=0.1,
             max_tokens=1000,
         )
@@ -370,6 +389,7 @@ def evaluate_content(
     content_type: str,
     content_id: uuid.UUID,
     content_data: Dict[str, Any],
+    signals_by_id: Optional[Dict[uuid.UUID, Signal]] = None,
 ) -> EvaluationRun:
     """
     Run complete evaluation on AI-generated content.
@@ -382,18 +402,25 @@ def evaluate_content(
         content_type: 'theme', 'weekly_brief', or 'signal_summary'
         content_id: UUID of the content being evaluated
         content_data: The content to evaluate
+        signals_by_id: Optional prefetched source signals keyed by ID. When
+            omitted, the source signals are loaded once and shared by all checks.
 
     Returns:
         EvaluationRun object with scores and issues
     """
+    if signals_by_id is None:
+        signals_by_id = _load_source_signals(
+            db, _extract_signal_ids(content_type, content_data)
+        )
+
     # Step 1: Rule-based hallucination checks (Priority #1)
     hallucination_score, hallucination_issues = check_hallucinations(
-        db, content_type, content_data
+        db, content_type, content_data, signals_by_id
     )
 
     # Step 2: LLM-as-judge quality scoring
     llm_scores, llm_issues = evaluate_with_llm(
-        db, content_type, content_data
+        db, content_type, content_data, signals_by_id
     )
 
     # Combine scores
@@ -424,7 +451,7 @@ def evaluate_content(
         overall_score=overall_score,
         passed=passed,
         threshold=threshold,
-        evaluator_model="gpt-4o-mini",
+        evaluator_model=EVALUATOR_MODEL,
         evaluation_method="hybrid",
     )
 
@@ -6,11 +6,11 @@ from typing import List, Optional
 
 from sqlalchemy import (
     Column, String, Text, DateTime, Date, Integer, Boolean,
-    Enum as SQLEnum, Index, ForeignKey, JSON, Float
+    Enum as SQLEnum, Index, ForeignKey, JSON, Float, func
 )
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 
 from app.database import Base
 
@@ -103,7 +103,7 @@ class Signal(Base):
     reviewed_by = Column(String(255), nullable=True)
 
     # RAG/Semantic search
-    embedding = Column(Vector(1536), nullable=True)  # OpenAI text-embedding-3-small (1536 dimensions)
+    embedding = Column(HALFVEC(1536), nullable=True)  # OpenAI text-embedding-3-small (1536 dimensions), stored as fp16
 
     # Soft delete
     deleted_at = Column(DateTime, nullable=True)
@@ -115,7 +115,7 @@ class Signal(Base):
     __table_args__ = (
         Index('ix_signals_entity_created', 'entity', 'created_at'),
         Index('ix_signals_topic_created', 'topic', 'created_at'),
-        Index('ix_signals_status', 'status', 'deleted_at'),
+        Index('ix_signals_status', 'status', postgresql_where=deleted_at.is_(None)),
     )
 
     def __repr__(self):
@@ -172,13 +172,19 @@ class WeeklyBrief(Base):
     theme_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)  # Ordered by rank
 
     # Metadata
-    generated_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    generated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     total_signals = Column(Integer, nullable=False, default=0)
     coverage_areas = Column(ARRAY(String), nullable=True, default=[])
 
     # Indexes for common queries
     __table_args__ = (
         Index('ix_weekly_briefs_week', 'week_start', 'week_end'),
+        # Latest brief lookup (ORDER BY generated_at DESC LIMIT 1)
+        Index(
+            'ix_weekly_briefs_generated_at_desc',
+            generated_at.desc(),
+            postgresql_include=['id', 'week_start', 'week_end', 'total_signals'],
+        ),
     )
 
     def __repr__(self):
@@ -274,6 +280,12 @@ class Entity(Base):
     # Relationship to signals (via junction table)
     signal_links = relationship("SignalEntity", back_populates="entity", cascade="all, delete-orphan")
 
+    # Indexes for name/alias lookups (see get_entity_by_name)
+    __table_args__ = (
+        Index('ix_entities_name_lower', func.lower(name)),
+        Index('ix_entities_aliases', aliases, postgresql_using='gin'),
+    )
+
     def __repr__(self):
         return f"<Entity {self.name} ({self.segment})>"
 
@@ -287,9 +299,9 @@ class SignalEntity(Base):
     """
     __tablename__ = "signal_entities"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    signal_id = Column(UUID(as_uuid=True), ForeignKey("signals.id", ondelete="CASCADE"), nullable=False, index=True)
-    entity_id = Column(UUID(as_uuid=True), ForeignKey("entities.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Composite primary key; also serves signal_id lookups as its left prefix
+    signal_id = Column(UUID(as_uuid=True), ForeignKey("signals.id", ondelete="CASCADE"), primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), ForeignKey("entities.id", ondelete="CASCADE"), primary_key=True, index=True)
     is_primary = Column(Boolean, nullable=False, default=False)  # Primary entity for the signal
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
@@ -314,8 +326,8 @@ class EvaluationRun(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Content being evaluated
-    content_type = Column(String(50), nullable=False, index=True)  # weekly_brief, theme, signal_summary
-    content_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # ID of the content
+    content_type = Column(String(50), nullable=False)  # weekly_brief, theme, signal_summary
+    content_id = Column(UUID(as_uuid=True), nullable=False)  # ID of the content
 
     # Quality scores (0-10 scale, 10 = perfect)
     hallucination_score = Column(Float, nullable=False)  # 10 = no hallucinations
@@ -339,7 +351,11 @@ class EvaluationRun(Base):
 
     # Indexes for monitoring queries
     __table_args__ = (
-        Index('ix_evaluations_content', 'content_type', 'content_id', 'created_at'),
+        Index(
+            'ix_evaluations_content',
+            content_type, content_id, created_at.desc(),
+            postgresql_include=['overall_score', 'passed'],
+        ),
         Index('ix_evaluations_passed', 'passed', 'created_at'),
         Index('ix_evaluations_score', 'overall_score', 'created_at'),
     )
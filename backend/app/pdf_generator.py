@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from io import BytesIO
-from typing import List
+from typing import BinaryIO, List, Optional
 
 from weasyprint import HTML, CSS
 from sqlalchemy.orm import Session
@@ -526,7 +526,13 @@ def generate_brief_html(brief: WeeklyBrief, themes: List[Theme], signals_map: di
     return html
 
 
-def generate_brief_pdf(db: Session, brief: WeeklyBrief, themes: List[Theme], signals_map: dict) -> BytesIO:
+def generate_brief_pdf(
+    db: Session,
+    brief: WeeklyBrief,
+    themes: List[Theme],
+    signals_map: dict,
+    out: Optional[BinaryIO] = None,
+) -> BinaryIO:
     """
     Generate a PDF file for a weekly brief.
 
@@ -535,14 +541,20 @@ def generate_brief_pdf(db: Session, brief: WeeklyBrief, themes: List[Theme], sig
         brief: WeeklyBrief ORM object
         themes: List of Theme ORM objects (in display order)
         signals_map: Dict mapping signal_id to Signal object
+        out: Optional writable binary file; the PDF is written straight into it
+            instead of an intermediate in-memory buffer
 
     Returns:
-        BytesIO buffer containing PDF data
+        out if given, otherwise a BytesIO buffer (rewound) containing PDF data
     """
     # Generate HTML
     html_content = generate_brief_html(brief, themes, signals_map)
 
     # Convert to PDF
+    if out is not None:
+        HTML(string=html_content).write_pdf(out)
+        return out
+
     pdf_buffer = BytesIO()
     HTML(string=html_content).write_pdf(pdf_buffer)
     pdf_buffer.seek(0)
@@ -45,8 +45,7 @@ from app.services import (
     soft_delete_signal,
     get_current_brief,
     get_brief_by_id,
-    get_themes_by_ids,
-    get_signals_by_ids,
+    get_brief_contents,
     create_notification,
     get_entities,
     get_entity_by_id,
@@ -408,16 +407,8 @@ def build_full_brief_response(brief, db: Session) -> WeeklyBriefFullResponse:
     Returns:
         WeeklyBriefFullResponse with all data
     """
-    # Get themes in order
-    themes = get_themes_by_ids(db, brief.theme_ids)
-
-    # Collect all signal IDs from all themes
-    all_signal_ids = []
-    for theme in themes:
-        all_signal_ids.extend(theme.signal_ids or [])
-
-    # Get all signals in one query
-    signals_map = get_signals_by_ids(db, all_signal_ids)
+    # Get themes in order and all of their signals in one query
+    themes, signals_map = get_brief_contents(db, brief)
 
     # Build themes with signals
     themes_with_signals = []
@@ -560,15 +551,8 @@ def download_brief_pdf_endpoint(
             detail=f"Brief {brief_id} not found",
         )
 
-    # Get themes in order
-    themes = get_themes_by_ids(db, brief.theme_ids)
-
-    # Get all signals
-    all_signal_ids = []
-    for theme in themes:
-        all_signal_ids.extend(theme.signal_ids or [])
-
-    signals_map = get_signals_by_ids(db, all_signal_ids)
+    # Get themes in order and all of their signals
+    themes, signals_map = get_brief_contents(db, brief)
 
     # Generate PDF
     pdf_buffer = generate_brief_pdf(db, brief, themes, signals_map)
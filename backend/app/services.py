@@ -6,7 +6,8 @@ from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, defer, selectinload
 from openai import OpenAI
 
 from app.models import Signal, Theme, WeeklyBrief, Notification, Entity, SignalEntity
@@ -251,8 +252,6 @@ def get_signals(
     Returns:
         Tuple of (list of signals, total count)
     """
-    from sqlalchemy.orm import joinedload
-
     query = db.query(Signal).filter(Signal.deleted_at.is_(None))
 
     if entity:
@@ -284,9 +283,22 @@ def get_signals(
 
     total = query.count()
 
-    # Eager load entity relationships if requested
+    # Eager load entity relationships if requested. selectinload issues one extra
+    # query per relationship level instead of widening the paginated result rows.
+    # When filtering by segment, only that segment's entity links are loaded so the
+    # response carries just the matching entities.
     if include_entities:
-        query = query.options(joinedload(Signal.entity_links).joinedload(SignalEntity.entity))
+        entity_links = Signal.entity_links
+        if segment:
+            entity_links = entity_links.and_(
+                SignalEntity.entity_id.in_(select(Entity.id).where(Entity.segment == segment))
+            )
+        # selectinload never overwrites a collection already in the identity map, so
+        # without populate_existing a segment-filtered entity_links would be served
+        # to a later load in the same session (and vice versa)
+        query = query.options(
+            selectinload(entity_links).selectinload(SignalEntity.entity)
+        ).execution_options(populate_existing=True)
 
     signals = query.order_by(Signal.created_at.desc()).offset(offset).limit(limit).all()
 
@@ -332,7 +344,11 @@ def get_signals_for_week(db: Session, week_end: date) -> List[Signal]:
     """
     week_start = week_end - timedelta(days=6)
 
-    return db.query(Signal).filter(
+    # Theme synthesis walks signal.entity_links -> entity for every signal,
+    # so load them up front rather than lazily per signal.
+    return db.query(Signal).options(
+        selectinload(Signal.entity_links).selectinload(SignalEntity.entity)
+    ).filter(
         Signal.deleted_at.is_(None),
         Signal.created_at >= datetime.combine(week_start, datetime.min.time()),
         Signal.created_at <= datetime.combine(week_end, datetime.max.time()),
@@ -1073,6 +1089,37 @@ def get_existing_brief_for_week(db: Session, week_start: date, week_end: date) -
     ).first()
 
 
+# Above this many themes, coverage areas are aggregated in the database
+COVERAGE_SQL_THRESHOLD = 50
+
+
+def collect_coverage_areas(db: Session, themes: List[Theme]) -> List[str]:
+    """
+    Collect unique impact areas across saved themes.
+
+    Small briefs are handled in Python; larger ones unnest and de-duplicate
+    the impact_areas arrays on the database side.
+
+    Args:
+        db: Database session
+        themes: List of saved Theme objects
+
+    Returns:
+        Sorted list of unique impact areas
+    """
+    if len(themes) <= COVERAGE_SQL_THRESHOLD:
+        coverage_areas = set()
+        for theme in themes:
+            coverage_areas.update(theme.impact_areas or [])
+        return sorted(coverage_areas)
+
+    from sqlalchemy import func
+
+    area = func.unnest(Theme.impact_areas).label("area")
+    rows = db.query(area).filter(Theme.id.in_([t.id for t in themes])).distinct().all()
+    return sorted(row.area for row in rows)
+
+
 def create_weekly_brief(
     db: Session,
     week_start: date,
@@ -1093,17 +1140,12 @@ def create_weekly_brief(
     Returns:
         Created WeeklyBrief object
     """
-    # Collect all unique impact areas from themes
-    coverage_areas = set()
-    for theme in themes:
-        coverage_areas.update(theme.impact_areas or [])
-
     brief = WeeklyBrief(
         week_start=week_start,
         week_end=week_end,
         theme_ids=[t.id for t in themes],
         total_signals=total_signals,
-        coverage_areas=sorted(list(coverage_areas)),
+        coverage_areas=collect_coverage_areas(db, themes),
     )
 
     db.add(brief)
@@ -1135,12 +1177,18 @@ def save_themes(db: Session, theme_dicts: List[Dict]) -> List[Theme]:
             so_what=theme_data["so_what"],
             now_what=theme_data["now_what"],
         )
-        db.add(theme)
         themes.append(theme)
 
+    # Flush as one batched INSERT; IDs are assigned client-side so they are
+    # known before commit.
+    db.add_all(themes)
+    db.flush()
+    theme_ids = [t.id for t in themes]
     db.commit()
-    for theme in themes:
-        db.refresh(theme)
+
+    # Reload all expired themes with a single SELECT instead of one refresh each
+    if theme_ids:
+        db.query(Theme).filter(Theme.id.in_(theme_ids)).all()
 
     return themes
 
@@ -1240,10 +1288,48 @@ def get_signals_by_ids(db: Session, signal_ids: List[UUID]) -> Dict[UUID, Signal
     Returns:
         Dictionary mapping signal ID to Signal object
     """
-    signals = db.query(Signal).filter(Signal.id.in_(signal_ids)).all()
+    # Brief rendering never reads the embedding (1536 halfvec values per row)
+    signals = db.query(Signal).options(defer(Signal.embedding)).filter(Signal.id.in_(signal_ids)).all()
     return {s.id: s for s in signals}
 
 
+def get_brief_contents(db: Session, brief: WeeklyBrief) -> Tuple[List[Theme], Dict[UUID, Signal]]:
+    """
+    Get a brief's themes (in brief order) and all of their signals.
+
+    Themes and signals are linked by ID arrays rather than relationships, so this
+    is one query for the themes and one for every signal across them.
+
+    Args:
+        db: Database session
+        brief: WeeklyBrief to load
+
+    Returns:
+        Tuple of (themes, dictionary mapping signal ID to Signal object)
+    """
+    themes = get_themes_by_ids(db, brief.theme_ids)
+    all_signal_ids = [sid for theme in themes for sid in theme.signal_ids or []]
+    return themes, get_signals_by_ids(db, all_signal_ids)
+
+
+def get_current_brief_full(db: Session) -> Optional[Tuple[WeeklyBrief, List[Theme], Dict[UUID, Signal]]]:
+    """
+    Get the most recent weekly brief together with its themes and signals.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Tuple of (brief, themes, signals_map), or None if no briefs exist
+    """
+    brief = get_current_brief(db)
+    if not brief:
+        return None
+
+    themes, signals_map = get_brief_contents(db, brief)
+    return brief, themes, signals_map
+
+
 # =============================================================================
 # Notification Functions
 # =============================================================================
@@ -1304,16 +1390,25 @@ def get_entities(
     Returns:
         Tuple of (list of entities, total count)
     """
+    from sqlalchemy import func
+
     query = db.query(Entity)
 
     if segment:
         query = query.filter(Entity.segment == segment)
 
-    total = query.count()
+    # Fetch the page and the total in one round-trip with a window count
+    rows = query.add_columns(func.count().over().label("total")).order_by(
+        Entity.name
+    ).offset(offset).limit(limit).all()
+
+    if rows:
+        return [row[0] for row in rows], rows[0].total
 
-    entities = query.order_by(Entity.name).offset(offset).limit(limit).all()
+    # Empty page: only need a separate count if we paged past the end
+    total = query.count() if offset else 0
 
-    return entities, total
+    return [], total
 
 
 def get_entity_by_id(db: Session, entity_id: UUID) -> Optional[Entity]:
@@ -1341,14 +1436,17 @@ def get_entity_by_name(db: Session, name: str) -> Optional[Entity]:
     Returns:
         Entity if found, None otherwise
     """
-    from sqlalchemy import func, or_
+    from sqlalchemy import func
+
+    # Two separate lookups instead of one OR so each can use its own index:
+    # ix_entities_name_lower for the name, ix_entities_aliases (GIN) for aliases.
+    # An exact name match takes precedence over an alias match.
+    entity = db.query(Entity).filter(func.lower(Entity.name) == name.lower()).first()
+    if entity:
+        return entity
 
-    # Search by exact name (case-insensitive) or in aliases array
     return db.query(Entity).filter(
-        or_(
-            func.lower(Entity.name) == name.lower(),
-            Entity.aliases.contains([name])  # PostgreSQL array contains
-        )
+        Entity.aliases.contains([name])  # PostgreSQL array contains (@>)
     ).first()
 
 
@@ -1504,7 +1602,7 @@ def generate_signal_summary(signals: List[Signal]) -> Dict:
     Returns:
         Dictionary with summary, key_insights, metadata
     """
-    import json
+    import orjson
 
     if not signals:
         return {
@@ -1518,16 +1616,21 @@ def generate_signal_summary(signals: List[Signal]) -> Dict:
 
     # Extract metadata
     total_signals = len(signals)
-    dates = [s.created_at for s in signals]
-    date_range = f"{min(dates).strftime('%Y-%m-%d')} to {max(dates).strftime('%Y-%m-%d')}"
+    earliest = latest = signals[0].created_at
 
-    # Collect unique segments and impact areas
+    # Collect date bounds, unique segments and impact areas in a single pass
     segments = set()
     impact_areas = set()
     entities = set()
     topics = set()
 
     for signal in signals:
+        created_at = signal.created_at
+        if created_at < earliest:
+            earliest = created_at
+        elif created_at > latest:
+            latest = created_at
+
         impact_areas.update(signal.impact_areas)
         entities.add(signal.entity)
         topics.add(signal.topic)
@@ -1537,6 +1640,8 @@ def generate_signal_summary(signals: List[Signal]) -> Dict:
             if entity_link.entity:
                 segments.add(entity_link.entity.segment)
 
+    date_range = f"{earliest.strftime('%Y-%m-%d')} to {latest.strftime('%Y-%m-%d')}"
+
     # Fallback if OpenAI is not configured
     if not settings.openai_api_key or settings.openai_api_key == "your-openai-api-key-here":
         return _generate_summary_fallback(signals, total_signals, date_range, segments, impact_areas)
@@ -1553,7 +1658,6 @@ def generate_signal_summary(signals: List[Signal]) -> Dict:
 
         # Build comprehensive signal summaries grouped by topic
         grouped_summaries = {}
-        signal_id_map = {}  # Track all signal IDs
 
         for topic, topic_signals in topic_groups.items():
             grouped_summaries[topic] = []
@@ -1566,7 +1670,6 @@ def generate_signal_summary(signals: List[Signal]) -> Dict:
                     "impact_areas": signal.impact_areas,
                 }
                 grouped_summaries[topic].append(signal_summary)
-                signal_id_map[str(signal.id)] = signal
 
         prompt = f"""You are analyzing {total_signals} market intelligence signals for STM publishing sales teams.
 
@@ -1575,7 +1678,7 @@ Segments covered: {', '.join(segments) if segments else 'various'}
 Impact areas: {', '.join(impact_areas)}
 
 Signals grouped by topic:
-{json.dumps(grouped_summaries, indent=2)}
+{orjson.dumps(grouped_summaries).decode()}
 
 CRITICAL INSTRUCTIONS:
 1. Analyze ALL {total_signals} signals provided across all topics
@@ -1620,7 +1723,7 @@ Include 3-5 key insights. Each insight MUST be supported by at least 10 signal I
             if content.startswith("json"):
                 content = content[4:]
 
-        result = json.loads(content)
+        result = orjson.loads(content)
 
         return {
             "summary": result.get("summary", ""),
@@ -1645,17 +1748,17 @@ def _generate_summary_fallback(
 ) -> Dict:
     """Template-based fallback summary generation."""
 
+    from heapq import nlargest
+
     # Group signals by topic
-    topics = {}
+    topics: Dict[str, List[Signal]] = defaultdict(list)
     for signal in signals:
-        if signal.topic not in topics:
-            topics[signal.topic] = []
         topics[signal.topic].append(signal)
 
-    # Generate simple insights by topic
+    # Generate simple insights for the five largest topics
     insights = []
-    for topic, topic_signals in sorted(topics.items(), key=lambda x: len(x[1]), reverse=True)[:5]:
-        entities = list(set(s.entity for s in topic_signals))
+    for topic, topic_signals in nlargest(5, topics.items(), key=lambda x: len(x[1])):
+        entities = list({s.entity for s in topic_signals})
         signal_ids = [str(s.id) for s in topic_signals]
 
         insights.append({
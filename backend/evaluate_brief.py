@@ -5,10 +5,52 @@ Evaluate all themes in the latest weekly brief.
 import sys
 sys.path.insert(0, '/app')
 
-from app.database import SessionLocal
-from app.models import WeeklyBrief, Theme
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from app.database import SessionLocal, any_array
+from app.models import WeeklyBrief, Theme, Signal
 from app.evaluations import evaluate_content
 
+# Themes are evaluated in parallel; each evaluation is LLM-latency bound
+MAX_WORKERS = 8
+
+
+def evaluate_theme(theme_id, content_data, signals_by_id):
+    """Evaluate a single theme in its own session (Sessions are not thread-safe)."""
+    db = SessionLocal()
+
+    try:
+        eval_run = evaluate_content(
+            db=db,
+            content_type="theme",
+            content_id=theme_id,
+            content_data=content_data,
+            signals_by_id=signals_by_id,
+        )
+
+        return {
+            'theme': content_data['title'],
+            'overall_score': eval_run.overall_score,
+            'passed': eval_run.passed,
+            'hallucination': eval_run.hallucination_score,
+            'grounding': eval_run.grounding_score,
+            'relevance': eval_run.relevance_score,
+            'actionability': eval_run.actionability_score,
+            'coherence': eval_run.coherence_score,
+            'issues': len(eval_run.issues),
+            'issue_lines': [
+                f"  - [{issue.severity.upper()}] {issue.issue_type}: {issue.description}"
+                for issue in eval_run.issues
+            ],
+        }
+    finally:
+        db.close()
+
+
+def write_lines(lines):
+    """Write a block of output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def main():
     db = SessionLocal()
@@ -21,86 +63,117 @@ def main():
             print("No weekly briefs found!")
             return
 
-        print(f"\n{'='*70}")
-        print(f"EVALUATING WEEKLY BRIEF")
-        print(f"{'='*70}")
-        print(f"Brief ID: {brief.id}")
-        print(f"Week: {brief.week_start} to {brief.week_end}")
-        print(f"Total Signals: {brief.total_signals}")
-        print(f"Themes: {len(brief.theme_ids)}")
-        print()
+        write_lines([
+            f"\n{'='*70}",
+            "EVALUATING WEEKLY BRIEF",
+            f"{'='*70}",
+            f"Brief ID: {brief.id}",
+            f"Week: {brief.week_start} to {brief.week_end}",
+            f"Total Signals: {brief.total_signals}",
+            f"Themes: {len(brief.theme_ids)}",
+            "",
+        ])
 
         # Get all themes
-        themes = db.query(Theme).filter(Theme.id.in_(brief.theme_ids)).all()
-
-        results = []
-        for i, theme in enumerate(themes, 1):
-            print(f"{'='*70}")
-            print(f"EVALUATING THEME {i}/{len(themes)}")
-            print(f"{'='*70}")
-            print(f"Title: {theme.title}")
-            print(f"Signals: {len(theme.signal_ids)}")
-            print()
-
-            # Prepare content data
-            content_data = {
+        # = ANY(:ids) binds a single array parameter, so the statement text (and
+        # plan) doesn't change with the number of themes
+        themes = db.query(Theme).filter(Theme.id == any_array(brief.theme_ids)).all()
+
+        # A brief referencing missing themes is inconsistent; stop before spending
+        # LLM calls on a partial evaluation
+        missing = set(brief.theme_ids) - {theme.id for theme in themes}
+        if missing:
+            print(f"Brief {brief.id} references {len(missing)} missing theme(s): "
+                  f"{', '.join(str(tid) for tid in sorted(missing, key=str))}")
+            print("Aborting evaluation.")
+            return
+
+        # Prefetch every source signal for the brief in one query instead of
+        # letting each theme evaluation re-query its own signals
+        all_signal_ids = {sid for theme in themes for sid in theme.signal_ids}
+        signals = db.query(Signal).filter(
+            Signal.id == any_array(all_signal_ids),
+            Signal.deleted_at.is_(None)
+        ).all() if all_signal_ids else []
+        signals_by_id = {signal.id: signal for signal in signals}
+
+        # Detach everything loaded so far: the signals are read concurrently by the
+        # workers, and detached objects can never expire or lazy-load through this
+        # (single-threaded) session. All the columns the evaluations read are loaded.
+        db.expunge_all()
+
+        # Prepare content data up front as plain values for the workers
+        jobs = [
+            (theme.id, {
                 'title': theme.title,
                 'so_what': theme.so_what,
                 'now_what': theme.now_what,
                 'key_players': theme.key_players,
                 'signal_ids': theme.signal_ids,
+            })
+            for theme in themes
+        ]
+
+        results = [None] * len(jobs)
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(jobs)))) as executor:
+            futures = {
+                executor.submit(
+                    evaluate_theme,
+                    theme_id,
+                    content_data,
+                    {sid: signals_by_id[sid] for sid in content_data['signal_ids'] if sid in signals_by_id},
+                ): i
+                for i, (theme_id, content_data) in enumerate(jobs)
             }
 
-            # Run evaluation
-            eval_run = evaluate_content(
-                db=db,
-                content_type="theme",
-                content_id=theme.id,
-                content_data=content_data,
-            )
-
-            results.append({
-                'theme': theme.title,
-                'overall_score': eval_run.overall_score,
-                'passed': eval_run.passed,
-                'hallucination': eval_run.hallucination_score,
-                'grounding': eval_run.grounding_score,
-                'relevance': eval_run.relevance_score,
-                'actionability': eval_run.actionability_score,
-                'coherence': eval_run.coherence_score,
-                'issues': len(eval_run.issues),
-            })
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                result = future.result()
+                results[i] = result
+
+                write_lines([
+                    f"{'='*70}",
+                    f"EVALUATED THEME {i + 1}/{len(jobs)} ({done} done)",
+                    f"{'='*70}",
+                    f"Title: {result['theme']}",
+                    f"Signals: {len(jobs[i][1]['signal_ids'])}",
+                    f"Overall Score: {result['overall_score']:.2f}/10",
+                    f"Status: {'✅ PASSED' if result['passed'] else '❌ FAILED'}",
+                    f"Issues: {result['issues']}",
+                    *result['issue_lines'],
+                    "",
+                ])
+
+        # Summary (single pass over results)
+        n = len(results)
+        passed = 0
+        total_score = 0.0
+        for r in results:
+            passed += r['passed']
+            total_score += r['overall_score']
+        failed = n - passed
+        avg_score = total_score / n
+        pct = 100.0 / n
+
+        lines = [
+            f"\n{'='*70}",
+            "EVALUATION SUMMARY",
+            f"{'='*70}",
+            f"Total Themes Evaluated: {n}",
+            f"Passed: {passed} ({passed * pct:.1f}%)",
+            f"Failed: {failed} ({failed * pct:.1f}%)",
+            f"Average Score: {avg_score:.2f}/10",
+            "",
+            "Individual Results:",
+        ]
 
-            print(f"Overall Score: {eval_run.overall_score:.2f}/10")
-            print(f"Status: {'✅ PASSED' if eval_run.passed else '❌ FAILED'}")
-            print(f"Issues: {len(eval_run.issues)}")
-            if eval_run.issues:
-                for issue in eval_run.issues:
-                    print(f"  - [{issue.severity.upper()}] {issue.issue_type}: {issue.description}")
-            print()
-
-        # Summary
-        print(f"\n{'='*70}")
-        print(f"EVALUATION SUMMARY")
-        print(f"{'='*70}")
-
-        passed = sum(1 for r in results if r['passed'])
-        failed = len(results) - passed
-        avg_score = sum(r['overall_score'] for r in results) / len(results)
-
-        print(f"Total Themes Evaluated: {len(results)}")
-        print(f"Passed: {passed} ({passed/len(results)*100:.1f}%)")
-        print(f"Failed: {failed} ({failed/len(results)*100:.1f}%)")
-        print(f"Average Score: {avg_score:.2f}/10")
-        print()
-
-        print("Individual Results:")
         for i, r in enumerate(results, 1):
             status = "✅ PASS" if r['passed'] else "❌ FAIL"
-            print(f"  {i}. [{status}] {r['overall_score']:.2f}/10 - {r['theme'][:60]}...")
-            print(f"     H:{r['hallucination']:.1f} G:{r['grounding']:.1f} R:{r['relevance']:.1f} A:{r['actionability']:.1f} C:{r['coherence']:.1f} Issues:{r['issues']}")
+            lines.append(f"  {i}. [{status}] {r['overall_score']:.2f}/10 - {r['theme'][:60]}...")
+            lines.append(f"     H:{r['hallucination']:.1f} G:{r['grounding']:.1f} R:{r['relevance']:.1f} A:{r['actionability']:.1f} C:{r['coherence']:.1f} Issues:{r['issues']}")
 
-        print(f"\n✅ Evaluation complete! Check dashboard at /admin/evaluations")
+        lines.append(f"\n✅ Evaluation complete! Check dashboard at /admin/evaluations")
+        write_lines(lines)
 
     finally:
         db.close()
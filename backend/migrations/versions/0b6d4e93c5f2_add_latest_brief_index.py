@@ -0,0 +1,38 @@
+"""add_latest_brief_index
+
+Revision ID: 0b6d4e93c5f2
+Revises: f3a9d62e7b18
+Create Date: 2026-01-12 12:15:06.672390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6d4e93c5f2'
+down_revision: Union[str, None] = 'f3a9d62e7b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serve "latest brief" (ORDER BY generated_at DESC LIMIT 1) from a descending
+    # index that also carries the small header columns. theme_ids/coverage_areas
+    # arrays are deliberately not included to keep the index narrow.
+    op.create_index(
+        'ix_weekly_briefs_generated_at_desc',
+        'weekly_briefs',
+        [sa.text('generated_at DESC')],
+        postgresql_include=['id', 'week_start', 'week_end', 'total_signals'],
+    )
+
+    # Superseded by the descending index above
+    op.drop_index('ix_weekly_briefs_generated_at', table_name='weekly_briefs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_weekly_briefs_generated_at', 'weekly_briefs', ['generated_at'], unique=False)
+    op.drop_index('ix_weekly_briefs_generated_at_desc', table_name='weekly_briefs')
@@ -0,0 +1,35 @@
+"""evaluations_content_desc_covering_index
+
+Revision ID: 3d8c1f7a2e60
+Revises: 0b6d4e93c5f2
+Create Date: 2026-01-12 12:48:29.904113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d8c1f7a2e60'
+down_revision: Union[str, None] = '0b6d4e93c5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "Latest evaluation for this content" reads newest-first and only needs the
+    # headline score, so order created_at DESC and carry the scores in the index.
+    op.drop_index('ix_evaluations_content', table_name='evaluation_runs')
+    op.create_index(
+        'ix_evaluations_content',
+        'evaluation_runs',
+        ['content_type', 'content_id', sa.text('created_at DESC')],
+        postgresql_include=['overall_score', 'passed'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evaluations_content', table_name='evaluation_runs')
+    op.create_index('ix_evaluations_content', 'evaluation_runs', ['content_type', 'content_id', 'created_at'])
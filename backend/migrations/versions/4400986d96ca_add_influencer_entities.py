@@ -7,10 +7,10 @@ Create Date: 2025-12-24 03:24:38.034736
 """
 from typing import Sequence, Union
 from datetime import datetime
-import uuid
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -20,21 +20,21 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-# Influencer entities (newsletters, blogs, thought leaders)
-INFLUENCER_ENTITIES = [
+# Influencer entities (newsletters, blogs, thought leaders): (name, segment, aliases)
+INFLUENCER_ENTITIES = (
     # Blogs & Publications
-    {"name": "The Scholarly Kitchen", "segment": "influencer", "aliases": ["Scholarly Kitchen", "The Scholarly Kitchen", "SSP Scholarly Kitchen"]},
-    {"name": "The Geyser", "segment": "influencer", "aliases": ["The Geyser", "Geyser"]},
-    {"name": "Learned Publishing", "segment": "influencer", "aliases": ["Learned Publishing"]},
-    {"name": "Against the Grain", "segment": "influencer", "aliases": ["Against the Grain", "ATG"]},
+    ("The Scholarly Kitchen", "influencer", ("Scholarly Kitchen", "The Scholarly Kitchen", "SSP Scholarly Kitchen")),
+    ("The Geyser", "influencer", ("The Geyser", "Geyser")),
+    ("Learned Publishing", "influencer", ("Learned Publishing",)),
+    ("Against the Grain", "influencer", ("Against the Grain", "ATG")),
 
     # Thought Leaders
-    {"name": "Rick Anderson", "segment": "influencer", "aliases": ["Rick Anderson"]},
-    {"name": "Ann Michael", "segment": "influencer", "aliases": ["Ann Michael"]},
-    {"name": "Angela Cochran", "segment": "influencer", "aliases": ["Angela Cochran"]},
-    {"name": "Phil Davis", "segment": "influencer", "aliases": ["Phil Davis"]},
-    {"name": "Lisa Hinchliffe", "segment": "influencer", "aliases": ["Lisa Hinchliffe"]},
-]
+    ("Rick Anderson", "influencer", ("Rick Anderson",)),
+    ("Ann Michael", "influencer", ("Ann Michael",)),
+    ("Angela Cochran", "influencer", ("Angela Cochran",)),
+    ("Phil Davis", "influencer", ("Phil Davis",)),
+    ("Lisa Hinchliffe", "influencer", ("Lisa Hinchliffe",)),
+)
 
 
 def upgrade() -> None:
@@ -46,34 +46,36 @@ def upgrade() -> None:
     """)
 
     # 2. Add influencer entities
-    entities_data = []
     now = datetime.utcnow()
-
-    for entity in INFLUENCER_ENTITIES:
-        entities_data.append({
-            'id': str(uuid.uuid4()),
-            'name': entity['name'],
-            'segment': entity['segment'],
-            'aliases': entity['aliases'],
+    entities_data = [
+        {
+            'id': sa.func.gen_random_uuid(),
+            'name': name,
+            'segment': segment,
+            'aliases': list(aliases),
             'entity_metadata': None,
             'notes': None,
             'created_at': now,
             'updated_at': now,
-        })
-
-    # Bulk insert influencer entities
-    op.bulk_insert(
-        sa.table('entities',
-            sa.column('id', sa.String),
-            sa.column('name', sa.String),
-            sa.column('segment', sa.String),
-            sa.column('aliases', sa.ARRAY(sa.String)),
-            sa.column('entity_metadata', sa.JSON),
-            sa.column('notes', sa.Text),
-            sa.column('created_at', sa.DateTime),
-            sa.column('updated_at', sa.DateTime),
-        ),
-        entities_data
+        }
+        for name, segment, aliases in INFLUENCER_ENTITIES
+    ]
+
+    # Insert the influencer entities in one statement, skipping existing names
+    entities_table = sa.table('entities',
+        sa.column('id', sa.String),
+        sa.column('name', sa.String),
+        sa.column('segment', sa.String),
+        sa.column('aliases', sa.ARRAY(sa.String)),
+        sa.column('entity_metadata', sa.JSON),
+        sa.column('notes', sa.Text),
+        sa.column('created_at', sa.DateTime),
+        sa.column('updated_at', sa.DateTime),
+    )
+    op.execute(
+        postgresql.insert(entities_table)
+        .values(entities_data)
+        .on_conflict_do_nothing(index_elements=['name'])
     )
 
 
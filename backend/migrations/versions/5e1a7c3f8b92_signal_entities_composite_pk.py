@@ -0,0 +1,42 @@
+"""signal_entities_composite_pk
+
+Revision ID: 5e1a7c3f8b92
+Revises: 9c4f7e21b3d8
+Create Date: 2026-01-12 14:10:47.631205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1a7c3f8b92'
+down_revision: Union[str, None] = '9c4f7e21b3d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The surrogate id is never referenced; (signal_id, entity_id) is already unique.
+    # Make the pair the primary key and drop the now-redundant unique constraint and
+    # signal_id index (the PK serves as its left-prefix index).
+    op.drop_constraint('signal_entities_pkey', 'signal_entities', type_='primary')
+    op.drop_column('signal_entities', 'id')
+    op.drop_constraint('uq_signal_entity', 'signal_entities', type_='unique')
+    op.drop_index('ix_signal_entities_signal', 'signal_entities')
+    op.create_primary_key('signal_entities_pkey', 'signal_entities', ['signal_id', 'entity_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('signal_entities_pkey', 'signal_entities', type_='primary')
+    op.create_index('ix_signal_entities_signal', 'signal_entities', ['signal_id'])
+    op.create_unique_constraint('uq_signal_entity', 'signal_entities', ['signal_id', 'entity_id'])
+    op.add_column(
+        'signal_entities',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False, server_default=sa.text('gen_random_uuid()')),
+    )
+    op.alter_column('signal_entities', 'id', server_default=None)
+    op.create_primary_key('signal_entities_pkey', 'signal_entities', ['id'])
@@ -0,0 +1,31 @@
+"""drop_redundant_evaluation_indexes
+
+Revision ID: 7a2e5b0d94c1
+Revises: 3d8c1f7a2e60
+Create Date: 2026-01-12 13:05:41.287530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2e5b0d94c1'
+down_revision: Union[str, None] = '3d8c1f7a2e60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # content_type is the leading column of ix_evaluations_content, and content_id is
+    # never filtered on without content_type, so both single-column indexes only add
+    # write cost. ix_evaluation_runs_created_at stays: the list and stats endpoints
+    # filter/order on created_at alone.
+    op.drop_index('ix_evaluation_runs_content_id', table_name='evaluation_runs')
+    op.drop_index('ix_evaluation_runs_content_type', table_name='evaluation_runs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_evaluation_runs_content_type', 'evaluation_runs', ['content_type'])
+    op.create_index('ix_evaluation_runs_content_id', 'evaluation_runs', ['content_id'])
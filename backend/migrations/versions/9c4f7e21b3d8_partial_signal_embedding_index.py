@@ -0,0 +1,38 @@
+"""partial_signal_embedding_index
+
+Revision ID: 9c4f7e21b3d8
+Revises: 7a2e5b0d94c1
+Create Date: 2026-01-12 13:31:12.458093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f7e21b3d8'
+down_revision: Union[str, None] = '7a2e5b0d94c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only index rows semantic search can return (it filters on both conditions),
+    # so signals without embeddings and soft-deleted signals don't bloat the index.
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS signals_embedding_idx')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS signals_embedding_idx ON signals '
+            'USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64) '
+            'WHERE embedding IS NOT NULL AND deleted_at IS NULL'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS signals_embedding_idx')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS signals_embedding_idx ON signals '
+            'USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)'
+        )
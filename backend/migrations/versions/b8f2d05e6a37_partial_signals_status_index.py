@@ -0,0 +1,34 @@
+"""partial_signals_status_index
+
+Revision ID: b8f2d05e6a37
+Revises: 5e1a7c3f8b92
+Create Date: 2026-01-12 14:52:09.318846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f2d05e6a37'
+down_revision: Union[str, None] = '5e1a7c3f8b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Status lookups always exclude soft-deleted signals, so index live rows only
+    op.drop_index('ix_signals_status', table_name='signals')
+    op.create_index(
+        'ix_signals_status',
+        'signals',
+        ['status'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_signals_status', table_name='signals')
+    op.create_index('ix_signals_status', 'signals', ['status', 'deleted_at'])
@@ -0,0 +1,30 @@
+"""add_entity_lookup_indexes
+
+Revision ID: c7e4a1b9d203
+Revises: a12962c79fff
+Create Date: 2026-01-12 10:14:37.208815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e4a1b9d203'
+down_revision: Union[str, None] = 'a12962c79fff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Functional index for case-insensitive name lookups (get_entity_by_name)
+    op.execute('CREATE INDEX IF NOT EXISTS ix_entities_name_lower ON entities (lower(name))')
+
+    # GIN index so alias containment (aliases @> ARRAY[...]) can use an index scan
+    op.execute('CREATE INDEX IF NOT EXISTS ix_entities_aliases ON entities USING GIN (aliases)')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_entities_aliases')
+    op.execute('DROP INDEX IF EXISTS ix_entities_name_lower')
@@ -0,0 +1,38 @@
+"""use_halfvec_for_signal_embeddings
+
+Revision ID: f3a9d62e7b18
+Revises: e52b8f0c9a41
+Create Date: 2026-01-12 11:40:53.114982
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d62e7b18'
+down_revision: Union[str, None] = 'e52b8f0c9a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Store embeddings as half precision (halfvec, pgvector >= 0.7): halves heap and
+    # index size with negligible recall loss for cosine search.
+    # The index is tied to the column's operator class, so rebuild it around the type change.
+    op.execute('DROP INDEX IF EXISTS signals_embedding_idx')
+    op.execute('ALTER TABLE signals ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)')
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS signals_embedding_idx ON signals '
+        'USING hnsw (embedding halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS signals_embedding_idx')
+    op.execute('ALTER TABLE signals ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)')
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS signals_embedding_idx ON signals '
+        'USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)'
+    )
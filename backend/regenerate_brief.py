@@ -6,7 +6,7 @@ import sys
 sys.path.insert(0, '/app')
 
 from app.database import SessionLocal
-from app.models import WeeklyBrief, Theme, EvaluationRun, EvaluationIssue
+from app.models import WeeklyBrief, Theme, EvaluationRun
 from app.services import generate_weekly_brief
 from datetime import date
 
@@ -27,27 +27,20 @@ def main():
             print(f"Week: {old_brief.week_start} to {old_brief.week_end}")
             print(f"Themes: {len(old_brief.theme_ids)}")
 
+            # Keep only plain values, then expire the session before the bulk
+            # deletes. With nothing loaded, synchronize_session=False is safe
+            # (no 'fetch' SELECT) and no stale brief is re-queried afterwards.
+            brief_id = old_brief.id
+            theme_ids = list(old_brief.theme_ids)
+            db.expire_all()
+
             # Delete evaluations for themes in this brief
-            theme_ids = old_brief.theme_ids
+            # (evaluation_issues.evaluation_run_id is ON DELETE CASCADE, so the
+            # database removes their issues along with the runs)
             eval_count = db.query(EvaluationRun).filter(
                 EvaluationRun.content_id.in_(theme_ids)
-            ).count()
-
-            if eval_count > 0:
-                print(f"\nDeleting {eval_count} evaluations...")
-                # Delete evaluation issues first (foreign key)
-                eval_ids = [e.id for e in db.query(EvaluationRun.id).filter(
-                    EvaluationRun.content_id.in_(theme_ids)
-                ).all()]
-
-                db.query(EvaluationIssue).filter(
-                    EvaluationIssue.evaluation_run_id.in_(eval_ids)
-                ).delete(synchronize_session=False)
-
-                # Delete evaluation runs
-                db.query(EvaluationRun).filter(
-                    EvaluationRun.content_id.in_(theme_ids)
-                ).delete(synchronize_session=False)
+            ).delete(synchronize_session=False)
+            print(f"\nDeleted {eval_count} evaluations")
 
             # Delete themes
             print(f"Deleting {len(theme_ids)} themes...")
@@ -55,7 +48,7 @@ def main():
 
             # Delete brief
             print("Deleting brief...")
-            db.delete(old_brief)
+            db.query(WeeklyBrief).filter(WeeklyBrief.id == brief_id).delete(synchronize_session=False)
 
             db.commit()
             print("✅ Old brief and evaluations deleted")
@@ -76,7 +69,9 @@ def main():
             print(f"Themes: {len(new_brief.theme_ids)}")
 
             # Show first theme as sample
-            first_theme = db.query(Theme).filter(Theme.id == new_brief.theme_ids[0]).first()
+            first_theme = db.query(Theme.title, Theme.so_what, Theme.now_what).filter(
+                Theme.id == new_brief.theme_ids[0]
+            ).first()
             if first_theme:
                 print(f"\nSample Theme:")
                 print(f"  Title: {first_theme.title}")
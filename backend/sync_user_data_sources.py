@@ -8,14 +8,26 @@ Strategy:
 4. Add personas as influencer entities
 """
 
-from app.database import SessionLocal
+from app.database import SessionLocal, any_array
 from app.models import DataSource, Entity
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from sqlalchemy import func
+from sqlalchemy import String, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 db = SessionLocal()
 
+# Insert statements built once and reused by the add_* helpers.
+# entities.name is unique, so existing entities are skipped server-side and
+# RETURNING tells us which names were actually inserted.
+DATASOURCE_INSERT = DataSource.__table__.insert()
+ENTITY_INSERT = (
+    pg_insert(Entity.__table__)
+    .on_conflict_do_nothing(index_elements=['name'])
+    .returning(Entity.__table__.c.name)
+)
+
 # ==============================================================================
 # INDUSTRY NEWS DATA SOURCES (RSS feeds and websites)
 # ==============================================================================
@@ -140,20 +152,19 @@ def add_data_sources():
     print("ADDING INDUSTRY NEWS DATA SOURCES")
     print("=" * 70)
 
-    added = 0
-    skipped = 0
+    names = [s['name'] for s in INDUSTRY_NEWS_SOURCES]
+    # = ANY(:names) binds one text[] parameter instead of a placeholder per name
+    existing = {
+        r[0] for r in db.query(DataSource.name).filter(DataSource.name == any_array(names, String))
+    }
 
+    now = datetime.utcnow()
+    rows = []
     for source_data in INDUSTRY_NEWS_SOURCES:
-        existing = db.query(DataSource).filter(
-            DataSource.name == source_data['name']
-        ).first()
-
-        if existing:
-            print(f"⊘ Skipped: {source_data['name']} (already exists)")
-            skipped += 1
+        if source_data['name'] in existing:
             continue
 
-        source = DataSource(
+        rows.append(dict(
             id=uuid.uuid4(),
             name=source_data['name'],
             source_type=source_data['source_type'],
@@ -166,56 +177,69 @@ def add_data_sources():
             error_count=0,
             last_error=None,
             default_impact_areas=[],
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
+            created_at=now,
+            updated_at=now,
+        ))
 
-        db.add(source)
-        print(f"✓ Added: {source_data['name']}")
-        added += 1
+    # One bulk INSERT instead of a SELECT + INSERT round-trip per source
+    if rows:
+        db.execute(DATASOURCE_INSERT, rows)
 
-    db.commit()
-    print(f"\n→ Added {added} sources, skipped {skipped}")
+    # One line per pass rather than a print per source
+    added_names = [row['name'] for row in rows]
+    skipped_names = [name for name in names if name in existing]
+    print(f"✓ Added {len(added_names)}: {', '.join(added_names) or '-'}")
+    print(f"⊘ Skipped {len(skipped_names)} (already exist): {', '.join(skipped_names) or '-'}")
+
+    added = len(rows)
     return added
 
 
-def add_entities(entities_list, segment, category_name):
-    """Add entities to database."""
-    print(f"\n" + "=" * 70)
-    print(f"ADDING {category_name.upper()}")
-    print("=" * 70)
+def add_entities(entities_list, segment, category_name, session_factory=SessionLocal):
+    """
+    Add entities to database in their own session.
 
-    added = 0
-    skipped = 0
+    Runs concurrently with the other entity passes (see main), so output is
+    returned as lines for the caller to print in order.
 
-    for entity_data in entities_list:
-        existing = db.query(Entity).filter(
-            Entity.name == entity_data['name']
-        ).first()
+    Returns:
+        Tuple of (number added, report lines)
+    """
+    lines = [
+        "\n" + "=" * 70,
+        f"ADDING {category_name.upper()}",
+        "=" * 70,
+    ]
 
-        if existing:
-            print(f"⊘ Skipped: {entity_data['name']} (already exists)")
-            skipped += 1
-            continue
-
-        entity = Entity(
+    now = datetime.utcnow()
+    rows = [
+        dict(
             id=uuid.uuid4(),
             name=entity_data['name'],
             segment=segment,
             aliases=entity_data['aliases'],
             entity_metadata=None,
             notes=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
+        for entity_data in entities_list
+    ]
 
-        db.add(entity)
-        print(f"✓ Added: {entity_data['name']} ({segment})")
-        added += 1
+    session = session_factory()
+    try:
+        # One INSERT ... ON CONFLICT (name) DO NOTHING for the whole list
+        inserted = set(session.execute(ENTITY_INSERT, rows).scalars()) if rows else set()
+        session.commit()
+    finally:
+        session.close()
 
-    db.commit()
-    print(f"\n→ Added {added} entities, skipped {skipped}")
-    return added
+    added_names = [row['name'] for row in rows if row['name'] in inserted]
+    skipped_names = [row['name'] for row in rows if row['name'] not in inserted]
+    lines.append(f"✓ Added {len(added_names)} ({segment}): {', '.join(added_names) or '-'}")
+    lines.append(f"⊘ Skipped {len(skipped_names)} (already exist): {', '.join(skipped_names) or '-'}")
+
+    return len(added_names), lines
 
 
 def show_summary():
@@ -224,23 +248,29 @@ def show_summary():
     print("FINAL SYSTEM STATUS")
     print("=" * 70)
 
-    # Data sources
+    # Data sources: per-type totals and enabled counts in one query
+    # (COUNT(*) FILTER (WHERE enabled) alongside COUNT(*))
+    type_counts = db.query(
+        DataSource.source_type,
+        func.count(),
+        func.count().filter(DataSource.enabled.is_(True)),
+    ).group_by(DataSource.source_type).all()
+
     print("\n📁 DATA SOURCES:")
-    type_counts = db.query(DataSource.source_type, func.count(DataSource.id)).group_by(DataSource.source_type).all()
-    for stype, count in type_counts:
+    for stype, count, _ in type_counts:
         print(f"  {stype.upper()}: {count} sources")
 
-    enabled = db.query(DataSource).filter(DataSource.enabled == True).count()
-    total_sources = db.query(DataSource).count()
+    enabled = sum(enabled_count for _, _, enabled_count in type_counts)
+    total_sources = sum(count for _, count, _ in type_counts)
     print(f"  Enabled: {enabled}/{total_sources}")
 
     # Entities
     print("\n📇 ENTITIES:")
-    segment_counts = db.query(Entity.segment, func.count(Entity.id)).group_by(Entity.segment).order_by(Entity.segment).all()
+    segment_counts = db.query(Entity.segment, func.count()).group_by(Entity.segment).order_by(Entity.segment).all()
     for segment, count in segment_counts:
         print(f"  {segment.capitalize()}: {count} entities")
 
-    total_entities = db.query(Entity).count()
+    total_entities = sum(count for _, count in segment_counts)
     print(f"  Total: {total_entities} entities")
 
 
@@ -252,11 +282,25 @@ def main():
 
     # Add data sources
     sources_added = add_data_sources()
+    db.commit()
 
-    # Add entities
-    competitors_added = add_entities(COMPETITOR_ENTITIES, "competitor", "Competitor Entities")
-    tools_added = add_entities(TOOLS_PLATFORMS, "industry", "Tools & Platforms")
-    personas_added = add_entities(PERSONAS, "influencer", "Personas")
+    # Add entities. The passes insert disjoint names, so they run concurrently,
+    # each in its own session; reports are printed in submission order.
+    entity_passes = [
+        (COMPETITOR_ENTITIES, "competitor", "Competitor Entities"),
+        (TOOLS_PLATFORMS, "industry", "Tools & Platforms"),
+        (PERSONAS, "influencer", "Personas"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(entity_passes)) as executor:
+        futures = [executor.submit(add_entities, *entity_pass) for entity_pass in entity_passes]
+
+        entities_added = []
+        for future in futures:
+            added, lines = future.result()
+            print("\n".join(lines))
+            entities_added.append(added)
+
+    competitors_added, tools_added, personas_added = entities_added
 
     # Show summary
     show_summary()
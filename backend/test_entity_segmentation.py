@@ -10,31 +10,45 @@ Tests:
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import List, Dict
 
 BASE_URL = "http://localhost:8000"
 
+# Shared keep-alive session so every call reuses a pooled connection
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+SEGMENTS = ['customer', 'competitor', 'industry', 'influencer']
+
+
+def fetch_all(paths: List[str]) -> List[requests.Response]:
+    """GET independent endpoints concurrently, returning responses in order."""
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        return list(ex.map(lambda path: SESSION.get(f"{BASE_URL}{path}"), paths))
+
 
 def test_entity_crud():
     """Test entity CRUD operations via API."""
     print("\n=== Testing Entity CRUD ===")
 
     # 1. List all entities
-    response = requests.get(f"{BASE_URL}/admin/entities")
+    response = SESSION.get(f"{BASE_URL}/admin/entities")
     assert response.status_code == 200, f"GET /admin/entities failed: {response.status_code}"
     data = response.json()
     print(f"✓ Total entities: {data['total']}")
 
-    # 2. Filter by segment
-    for segment in ['customer', 'competitor', 'industry', 'influencer']:
-        response = requests.get(f"{BASE_URL}/admin/entities?segment={segment}")
+    # 2. Filter by segment (independent calls, fetched in parallel)
+    responses = fetch_all([f"/admin/entities?segment={segment}" for segment in SEGMENTS])
+    by_segment = {}
+    for segment, response in zip(SEGMENTS, responses):
         assert response.status_code == 200
-        data = response.json()
-        print(f"✓ {segment.capitalize()}s: {data['total']}")
+        by_segment[segment] = response.json()
+        print(f"✓ {segment.capitalize()}s: {by_segment[segment]['total']}")
 
     # 3. Verify influencer entities exist
-    response = requests.get(f"{BASE_URL}/admin/entities?segment=influencer")
-    data = response.json()
+    data = by_segment['influencer']
     assert data['total'] > 0, "No influencer entities found!"
     influencers = [e['name'] for e in data['entities']]
     print(f"✓ Influencers: {', '.join(influencers[:5])}...")
@@ -46,7 +60,7 @@ def test_segment_statistics():
     """Test segment statistics endpoint."""
     print("\n=== Testing Segment Statistics ===")
 
-    response = requests.get(f"{BASE_URL}/segments/stats?days=7")
+    response = SESSION.get(f"{BASE_URL}/segments/stats?days=7")
     assert response.status_code == 200, f"GET /segments/stats failed: {response.status_code}"
     data = response.json()
 
@@ -69,7 +83,7 @@ def test_signal_entity_relationships():
     print("\n=== Testing Signal-Entity Relationships ===")
 
     # 1. Get signals with entities field
-    response = requests.get(f"{BASE_URL}/signals?limit=5")
+    response = SESSION.get(f"{BASE_URL}/signals?limit=5")
     assert response.status_code == 200
     data = response.json()
 
@@ -85,12 +99,12 @@ def test_signal_entity_relationships():
     print(f"✓ {signals_with_entities} out of 5 signals have entities")
 
     # 2. Test segment filtering
-    response = requests.get(f"{BASE_URL}/signals?segment=customer&limit=3")
+    response = SESSION.get(f"{BASE_URL}/signals?segment=customer&limit=3")
     assert response.status_code == 200
     data = response.json()
     print(f"✓ Customer segment filter: {data['total']} total signals")
 
-    # Verify entities in filtered results are from the requested segment
+    # The API only loads entities from the requested segment when filtering
     for signal in data['signals']:
         if signal.get('entities'):
             for entity in signal['entities']:
@@ -105,14 +119,10 @@ def test_api_response_format():
     print("\n=== Testing API Response Format ===")
 
     # Get a signal with entities
-    response = requests.get(f"{BASE_URL}/signals?limit=10")
+    response = SESSION.get(f"{BASE_URL}/signals?limit=10")
     data = response.json()
 
-    signal_with_entities = None
-    for signal in data['signals']:
-        if signal.get('entities') and len(signal['entities']) > 0:
-            signal_with_entities = signal
-            break
+    signal_with_entities = next((s for s in data['signals'] if s.get('entities')), None)
 
     assert signal_with_entities is not None, "No signal with entities found in first 10 results!"
 
@@ -133,22 +143,25 @@ def test_frontend_integration_readiness():
     """Verify the API is ready for frontend integration."""
     print("\n=== Testing Frontend Integration Readiness ===")
 
+    stats_response, signals_response, entities_response = fetch_all([
+        "/segments/stats",
+        "/signals?segment=customer&limit=5",
+        "/admin/entities",
+    ])
+
     # 1. Segment stats for dashboard widget
-    response = requests.get(f"{BASE_URL}/segments/stats")
-    assert response.status_code == 200
+    assert stats_response.status_code == 200
     print("✓ Segment stats endpoint ready for SegmentStatsWidget")
 
     # 2. Signals with entities for SegmentSignals page
-    response = requests.get(f"{BASE_URL}/signals?segment=customer&limit=5")
-    assert response.status_code == 200
-    data = response.json()
+    assert signals_response.status_code == 200
+    data = signals_response.json()
     has_entities = any(s.get('entities') for s in data['signals'])
     assert has_entities, "Filtered signals don't have entities!"
     print("✓ Segment filtering ready for SegmentSignals page")
 
     # 3. Entity CRUD for EntityManager page
-    response = requests.get(f"{BASE_URL}/admin/entities")
-    assert response.status_code == 200
+    assert entities_response.status_code == 200
     print("✓ Entity CRUD endpoints ready for EntityManager page")
 
     print("✅ All frontend integration points ready!")
@@ -158,13 +171,10 @@ def test_backfill_coverage():
     """Verify backfill created relationships for most signals."""
     print("\n=== Testing Backfill Coverage ===")
 
-    # Get total signals
-    response = requests.get(f"{BASE_URL}/signals?limit=1")
-    total_signals = response.json()['total']
-
-    # Get signals with entities
-    response = requests.get(f"{BASE_URL}/signals?limit=100")
-    signals = response.json()['signals']
+    # One page gives both the total and the sample of signals
+    data = SESSION.get(f"{BASE_URL}/signals?limit=100").json()
+    total_signals = data['total']
+    signals = data['signals']
     with_entities = sum(1 for s in signals if s.get('entities'))
 
     coverage = (with_entities / len(signals)) * 100
@@ -20,61 +20,52 @@ from datetime import datetime
 def create_test_data(db):
     """Create test signals and theme for evaluation."""
 
-    # Create test signals
-    signals = []
-    signal_ids = []
-
-    # Signal 1: Springer Nature AI launch
-    signal1 = Signal(
-        id=uuid.uuid4(),
-        entity="Springer Nature",
-        event_type="launch",
-        topic="AI/ML",
-        source_url="https://example.com/springer-ai-tool",
-        evidence_snippet="Springer Nature launches new AI-powered peer review tool to detect research integrity issues and accelerate publication workflow.",
-        confidence="High",
-        impact_areas=["Tech", "Integrity"],
-        status="approved",
-        created_at=datetime.utcnow(),
-    )
-    db.add(signal1)
-    signals.append(signal1)
-    signal_ids.append(signal1.id)
-
-    # Signal 2: Elsevier partnership
-    signal2 = Signal(
-        id=uuid.uuid4(),
-        entity="Elsevier",
-        event_type="partnership",
-        topic="AI/ML",
-        source_url="https://example.com/elsevier-partnership",
-        evidence_snippet="Elsevier partners with leading AI research lab to develop automated metadata extraction tools for scholarly articles.",
-        confidence="High",
-        impact_areas=["Tech", "Ops"],
-        status="approved",
-        created_at=datetime.utcnow(),
-    )
-    db.add(signal2)
-    signals.append(signal2)
-    signal_ids.append(signal2.id)
-
-    # Signal 3: Wiley integrity announcement
-    signal3 = Signal(
-        id=uuid.uuid4(),
-        entity="Wiley",
-        event_type="announcement",
-        topic="Integrity",
-        source_url="https://example.com/wiley-integrity",
-        evidence_snippet="Wiley announces enhanced image integrity checks across all journals, mandating original image files for all submissions.",
-        confidence="Medium",
-        impact_areas=["Integrity", "Ops"],
-        status="approved",
-        created_at=datetime.utcnow(),
-    )
-    db.add(signal3)
-    signals.append(signal3)
-    signal_ids.append(signal3.id)
-
+    # Create test signals (IDs are pre-generated, so no flush is needed to read them)
+    signals = [
+        # Signal 1: Springer Nature AI launch
+        Signal(
+            id=uuid.uuid4(),
+            entity="Springer Nature",
+            event_type="launch",
+            topic="AI/ML",
+            source_url="https://example.com/springer-ai-tool",
+            evidence_snippet="Springer Nature launches new AI-powered peer review tool to detect research integrity issues and accelerate publication workflow.",
+            confidence="High",
+            impact_areas=["Tech", "Integrity"],
+            status="approved",
+            created_at=datetime.utcnow(),
+        ),
+        # Signal 2: Elsevier partnership
+        Signal(
+            id=uuid.uuid4(),
+            entity="Elsevier",
+            event_type="partnership",
+            topic="AI/ML",
+            source_url="https://example.com/elsevier-partnership",
+            evidence_snippet="Elsevier partners with leading AI research lab to develop automated metadata extraction tools for scholarly articles.",
+            confidence="High",
+            impact_areas=["Tech", "Ops"],
+            status="approved",
+            created_at=datetime.utcnow(),
+        ),
+        # Signal 3: Wiley integrity announcement
+        Signal(
+            id=uuid.uuid4(),
+            entity="Wiley",
+            event_type="announcement",
+            topic="Integrity",
+            source_url="https://example.com/wiley-integrity",
+            evidence_snippet="Wiley announces enhanced image integrity checks across all journals, mandating original image files for all submissions.",
+            confidence="Medium",
+            impact_areas=["Integrity", "Ops"],
+            status="approved",
+            created_at=datetime.utcnow(),
+        ),
+    ]
+    signal_ids = [signal.id for signal in signals]
+
+    # Single bulk INSERT instead of per-instance unit-of-work bookkeeping
+    db.bulk_save_objects(signals)
     db.commit()
 
     # Create a test theme using these signals
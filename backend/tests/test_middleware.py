@@ -74,10 +74,11 @@ class TestRateLimiting:
 
     def test_rate_limit_not_applied_to_public_endpoints(self, client):
         """Test rate limiting is not applied to non-admin endpoints."""
-        # Make multiple requests to public endpoint
-        for _ in range(10):
-            response = client.get("/health")
-            assert response.status_code == 200
+        # RateLimitMiddleware returns before recording anything for non-/admin
+        # paths, and 10 calls never approached the 100/min limit anyway, so one
+        # request proves the same thing
+        response = client.get("/health")
+        assert response.status_code == 200
 
     def test_admin_endpoint_rate_limited(self, client, auth_headers, sample_signal):
         """Test admin endpoints are rate limited."""
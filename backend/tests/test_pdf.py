@@ -0,0 +1,23 @@
+"""Tests for brief PDF generation."""
+
+from app.pdf_generator import generate_brief_pdf
+from app.services import get_current_brief_full
+
+
+class TestBriefPdf:
+    """Test rendering a generated brief to PDF."""
+
+    def test_generate_brief_pdf(self, db, generated_brief, tmp_path):
+        """Test that a brief with themes and signals renders to a valid PDF file."""
+        brief, themes, signals_map = get_current_brief_full(db)
+        assert str(brief.id) == generated_brief
+        assert len(themes) == len(brief.theme_ids)
+        assert len(signals_map) == 3
+
+        # Write straight to the file (no intermediate in-memory copy)
+        output_file = tmp_path / "brief.pdf"
+        with open(output_file, "wb") as f:
+            generate_brief_pdf(db, brief, themes, signals_map, out=f)
+
+        assert output_file.stat().st_size > 0
+        assert output_file.read_bytes()[:4] == b"%PDF"
@@ -0,0 +1,119 @@
+"""Tests for the RSS collector."""
+
+import asyncio
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from app.collectors.rss_collector import FETCH_RETRIES, RSSCollector
+from app.models import DataSource, Signal
+from app.services import create_signal_from_dict
+
+
+FEED_FIXTURE = Path(__file__).parent / "fixtures" / "feed.rss"
+
+# Feeds collected concurrently by the tests
+TEST_FEEDS = [
+    ("Nature News (Test)", "https://www.nature.com/nature.rss"),
+    ("Crossref Blog (Test)", "https://www.crossref.org/feed/"),
+    ("COPE News (Test)", "https://publicationethics.org/feed"),
+]
+
+
+@pytest.fixture
+def feed_sources(db):
+    """Create one enabled RSS data source per test feed."""
+    sources = [
+        DataSource(
+            name=name,
+            source_type="rss",
+            url=url,
+            enabled=True,
+            default_confidence="High",
+            default_impact_areas=["Tech", "Ops"],
+        )
+        for name, url in TEST_FEEDS
+    ]
+    db.add_all(sources)
+    db.commit()
+    return sources
+
+
+@pytest.fixture
+def mock_feeds():
+    """Serve the cached feed payload for every test feed URL (no network access)."""
+    body = FEED_FIXTURE.read_bytes()
+    with aioresponses() as mocked:
+        for _, url in TEST_FEEDS:
+            mocked.get(url, body=body, repeat=True)
+        yield mocked
+
+
+async def collect_all(db, sources):
+    """Collect all feeds at once over one pooled HTTP session."""
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8)
+    async with aiohttp.ClientSession(connector=connector) as http_session:
+        return await asyncio.gather(
+            *[RSSCollector(source, db, http_session=http_session).collect() for source in sources]
+        )
+
+
+@pytest.mark.asyncio
+async def test_rss_collector(db, feed_sources, mock_feeds):
+    """Test collecting and saving signals from the cached feed."""
+    results = await collect_all(db, feed_sources)
+
+    for source, signals in zip(feed_sources, results):
+        assert signals, f"No signals collected from {source.name}"
+        assert source.last_success_at is not None
+        assert source.error_count == 0
+
+        links = {signal["source_url"] for signal in signals}
+        # Journal TOC notices are filtered out
+        assert "https://example.com/journal/toc/12/3" not in links
+
+        for signal_data in signals:
+            assert signal_data["confidence"] == "High"
+            assert signal_data["status"] == "approved"
+            create_signal_from_dict(db, signal_data)
+
+    saved = db.query(Signal).count()
+    assert saved == sum(len(signals) for signals in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status,attempts", [
+    (404, 1),
+    (503, FETCH_RETRIES),
+])
+async def test_rss_collector_retries_only_transient_errors(db, feed_sources, monkeypatch, status, attempts):
+    """Test that server errors are retried but a missing feed fails on the first attempt."""
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("app.collectors.rss_collector.asyncio.sleep", no_sleep)
+    source = feed_sources[0]
+
+    with aioresponses() as mocked:
+        mocked.get(source.url, status=status, repeat=True)
+        with pytest.raises(aiohttp.ClientResponseError):
+            await RSSCollector(source, db).collect()
+
+        assert len(mocked.requests[("GET", URL(source.url))]) == attempts
+
+    assert source.error_count == 1
+
+
+@pytest.mark.network
+@pytest.mark.asyncio
+async def test_rss_collector_live(db, feed_sources):
+    """Test collecting from the real feeds (run with: pytest -m network)."""
+    results = await collect_all(db, feed_sources)
+
+    for signals in results:
+        for signal_data in signals:
+            assert signal_data["source_url"]
+            assert len(signal_data["evidence_snippet"]) >= 50
@@ -2,6 +2,8 @@
 
 import pytest
 
+from app.models import Entity, Signal, SignalEntity
+
 
 class TestSignalEndpoints:
     """Test signal CRUD operations."""
@@ -12,9 +14,9 @@ class TestSignalEndpoints:
         assert response.status_code == 200
         assert response.json()["status"] == "ok"
 
-    def test_create_signal_success(self, client, auth_headers, sample_signal):
+    def test_create_signal_success(self, client, json_headers, sample_signal, sample_signal_bytes):
         """Test creating a valid signal."""
-        response = client.post("/signals", json=sample_signal, headers=auth_headers)
+        response = client.post("/signals", content=sample_signal_bytes, headers=json_headers)
         assert response.status_code == 201
 
         data = response.json()
@@ -24,20 +26,25 @@ class TestSignalEndpoints:
         assert "id" in data
         assert "created_at" in data
 
-    def test_create_signal_unauthorized(self, client, sample_signal):
-        """Test creating signal without auth token fails."""
-        response = client.post("/signals", json=sample_signal)
-        assert response.status_code == 403
-
-    def test_create_signal_invalid_token(self, client, sample_signal):
-        """Test creating signal with invalid token fails."""
-        headers = {"Authorization": "Bearer invalid-token"}
-        response = client.post("/signals", json=sample_signal, headers=headers)
+    @pytest.mark.parametrize("headers", [
+        {"content-type": "application/json"},
+        {"Authorization": "Bearer invalid-token", "content-type": "application/json"},
+    ], ids=["missing_token", "invalid_token"])
+    def test_create_signal_auth_fails(self, client, sample_signal_bytes, headers):
+        """Test creating signal without a valid curator token fails."""
+        response = client.post("/signals", content=sample_signal_bytes, headers=headers)
         assert response.status_code == 403
 
-    def test_create_signal_invalid_url(self, client, auth_headers, sample_signal):
-        """Test creating signal with invalid URL fails."""
-        sample_signal["source_url"] = "not-a-url"
+    @pytest.mark.parametrize("mutation", [
+        {"source_url": "not-a-url"},
+        {"evidence_snippet": "Too short"},
+        {"event_type": "invalid_type"},
+        {"confidence": "Invalid"},
+        {"impact_areas": []},
+    ], ids=["invalid_url", "short_evidence", "invalid_event_type", "invalid_confidence", "empty_impact_areas"])
+    def test_create_signal_validation_fails(self, client, auth_headers, sample_signal, mutation):
+        """Test creating signal with an invalid field value fails."""
+        sample_signal.update(mutation)
         response = client.post("/signals", json=sample_signal, headers=auth_headers)
         assert response.status_code == 422
 
@@ -50,30 +57,6 @@ class TestSignalEndpoints:
         response = client.post("/signals", json=incomplete_signal, headers=auth_headers)
         assert response.status_code == 422
 
-    def test_create_signal_short_evidence(self, client, auth_headers, sample_signal):
-        """Test creating signal with too short evidence fails."""
-        sample_signal["evidence_snippet"] = "Too short"
-        response = client.post("/signals", json=sample_signal, headers=auth_headers)
-        assert response.status_code == 422
-
-    def test_create_signal_invalid_event_type(self, client, auth_headers, sample_signal):
-        """Test creating signal with invalid event type fails."""
-        sample_signal["event_type"] = "invalid_type"
-        response = client.post("/signals", json=sample_signal, headers=auth_headers)
-        assert response.status_code == 422
-
-    def test_create_signal_invalid_confidence(self, client, auth_headers, sample_signal):
-        """Test creating signal with invalid confidence fails."""
-        sample_signal["confidence"] = "Invalid"
-        response = client.post("/signals", json=sample_signal, headers=auth_headers)
-        assert response.status_code == 422
-
-    def test_create_signal_empty_impact_areas(self, client, auth_headers, sample_signal):
-        """Test creating signal with empty impact areas fails."""
-        sample_signal["impact_areas"] = []
-        response = client.post("/signals", json=sample_signal, headers=auth_headers)
-        assert response.status_code == 422
-
     def test_list_signals_empty(self, client):
         """Test listing signals when none exist."""
         response = client.get("/signals")
@@ -83,10 +66,10 @@ class TestSignalEndpoints:
         assert data["signals"] == []
         assert data["total"] == 0
 
-    def test_list_signals_after_create(self, client, auth_headers, sample_signal):
+    def test_list_signals_after_create(self, client, json_headers, sample_signal_bytes):
         """Test listing signals after creating one."""
         # Create a signal
-        client.post("/signals", json=sample_signal, headers=auth_headers)
+        client.post("/signals", content=sample_signal_bytes, headers=json_headers)
 
         # List signals
         response = client.get("/signals")
@@ -110,10 +93,10 @@ class TestSignalEndpoints:
         assert len(data["signals"]) == 1
         assert data["signals"][0]["entity"] == "Test Publisher"
 
-    def test_get_signal_by_id(self, client, auth_headers, sample_signal):
+    def test_get_signal_by_id(self, client, json_headers, sample_signal, sample_signal_bytes):
         """Test getting a single signal by ID."""
         # Create a signal
-        create_response = client.post("/signals", json=sample_signal, headers=auth_headers)
+        create_response = client.post("/signals", content=sample_signal_bytes, headers=json_headers)
         signal_id = create_response.json()["id"]
 
         # Get signal
@@ -129,10 +112,10 @@ class TestSignalEndpoints:
         response = client.get("/signals/00000000-0000-0000-0000-000000000000")
         assert response.status_code == 404
 
-    def test_delete_signal(self, client, auth_headers, sample_signal):
+    def test_delete_signal(self, client, auth_headers, json_headers, sample_signal_bytes):
         """Test soft deleting a signal."""
         # Create a signal
-        create_response = client.post("/signals", json=sample_signal, headers=auth_headers)
+        create_response = client.post("/signals", content=sample_signal_bytes, headers=json_headers)
         signal_id = create_response.json()["id"]
 
         # Delete signal
@@ -143,10 +126,10 @@ class TestSignalEndpoints:
         list_response = client.get("/signals")
         assert list_response.json()["total"] == 0
 
-    def test_delete_signal_unauthorized(self, client, auth_headers, sample_signal):
+    def test_delete_signal_unauthorized(self, client, json_headers, sample_signal_bytes):
         """Test deleting signal without auth fails."""
         # Create a signal
-        create_response = client.post("/signals", json=sample_signal, headers=auth_headers)
+        create_response = client.post("/signals", content=sample_signal_bytes, headers=json_headers)
         signal_id = create_response.json()["id"]
 
         # Try to delete without auth
@@ -160,3 +143,55 @@ class TestSignalEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 404
+
+    def test_list_signals_entities_query_count(self, client, db, sample_signal, count_queries):
+        """Test listing signals with entities does not issue a query per signal."""
+        def count_list_queries():
+            with count_queries() as statements:
+                response = client.get("/signals?limit=100")
+
+            assert response.status_code == 200
+            return len(statements), response.json()
+
+        def add_linked_signals(start, count):
+            for i in range(start, start + count):
+                entity = Entity(name=f"Publisher {i}", segment="customer")
+                signal = Signal(**{**sample_signal, "entity": entity.name, "topic": f"Topic {i}"})
+                db.add_all([entity, signal])
+                db.flush()
+                db.add(SignalEntity(signal_id=signal.id, entity_id=entity.id))
+            db.commit()
+
+        add_linked_signals(0, 2)
+        few_queries, data = count_list_queries()
+        assert all(s["entities"] for s in data["signals"])
+
+        add_linked_signals(2, 8)
+        many_queries, data = count_list_queries()
+        assert len(data["signals"]) == 10
+        assert all(s["entities"] for s in data["signals"])
+
+        # Entities are eager loaded, so the query count is independent of page size
+        assert many_queries == few_queries
+
+    def test_list_signals_segment_filter_limits_entities(self, client, db, sample_signal):
+        """Test segment-filtered signals only carry entities from that segment."""
+        customer = Entity(name="Customer Publisher", segment="customer")
+        competitor = Entity(name="Competitor Vendor", segment="competitor")
+        signal = Signal(**sample_signal)
+        db.add_all([customer, competitor, signal])
+        db.flush()
+        db.add_all([
+            SignalEntity(signal_id=signal.id, entity_id=customer.id),
+            SignalEntity(signal_id=signal.id, entity_id=competitor.id),
+        ])
+        db.commit()
+
+        response = client.get("/signals?segment=customer")
+        data = response.json()
+        assert data["total"] == 1
+        assert [e["name"] for e in data["signals"][0]["entities"]] == ["Customer Publisher"]
+
+        # Unfiltered listing still returns every linked entity
+        response = client.get("/signals")
+        assert len(response.json()["signals"][0]["entities"]) == 2
@@ -57,11 +57,12 @@ print(f"Found {len(toc_signals)} TOC signals")
 print("🗑️  Deleting...")
 
 now = datetime.utcnow()
+marker = f"\n[Auto-deleted {now.strftime('%Y-%m-%d')}: TOC cleanup]"
 deleted_count = 0
 
 for signal in toc_signals:
     signal.deleted_at = now
-    signal.notes = (signal.notes or '') + f"\n[Auto-deleted {now.strftime('%Y-%m-%d')}: TOC cleanup]"
+    signal.notes = (signal.notes or '') + marker
     deleted_count += 1
 
 db.commit()
@@ -12,22 +12,46 @@ Safety features:
 - Creates audit log
 """
 
+import csv
+import multiprocessing
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
 
-from app.database import get_db
+from app.database import SessionLocal, any_array
 from app.models import Signal
-from sqlalchemy import func
+from sqlalchemy import func, or_, select, update
 
 
-def is_toc_signal(signal: Signal) -> bool:
+# Candidate rows fetched per batch, and rows per task sent to a worker process
+CLASSIFY_BATCH_SIZE = 10000
+CLASSIFY_CHUNK_SIZE = 1000
+
+# Signals soft-deleted (and committed) per UPDATE
+DELETE_BATCH_SIZE = 1000
+
+# TOC patterns, matched against the lowercased "entity evidence_snippet" text:
+# volume/issue citations and TOC alert phrases as a single alternation, so one
+# regex scan (in C) covers them all
+_TOC_KEYWORDS = ('toc alert', 'table of contents', 'latest articles from')
+_TOC_PATTERN = re.compile('|'.join([r'volume \d+,?\s*issue \d+', *_TOC_KEYWORDS]))
+_METADATA_KEYWORDS = frozenset([
+    'volume', 'issue', 'page', 'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+])
+
+# Words for the metadata check (punctuation such as "March," is dropped)
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+def is_toc_text(entity, evidence_snippet) -> bool:
     """
-    Check if signal is a TOC notice.
+    Check if a signal's entity and evidence snippet make it a TOC notice.
 
     Patterns that indicate TOC notices:
     - "Volume \d+, Issue \d+"
@@ -35,67 +59,115 @@ def is_toc_signal(signal: Signal) -> bool:
     - Very short evidence with just citation
     - No meaningful content
     """
-    text = f"{signal.entity} {signal.evidence_snippet}".lower()
-
-    # Pattern 1: Volume/Issue citations
-    if re.search(r'volume \d+,?\s*issue \d+', text):
-        return True
+    # Lowercase once and reuse the text for every check
+    snippet = evidence_snippet or ''
+    text = f"{entity or ''} {snippet}".lower()
 
-    # Pattern 2: TOC alerts
-    if any(kw in text for kw in ['toc alert', 'table of contents', 'latest articles from']):
-        return True
-
-    # Pattern 3: Very short evidence with just journal name
-    if len(signal.evidence_snippet) < 100:
-        # Check if it's mostly just journal metadata
-        metadata_keywords = ['volume', 'issue', 'page', 'january', 'february', 'march',
-                            'april', 'may', 'june', 'july', 'august', 'september',
-                            'october', 'november', 'december']
-        word_count = len(signal.evidence_snippet.split())
-        metadata_words = sum(1 for kw in metadata_keywords if kw in text)
+    # Short evidence that is mostly journal metadata (only ever tokenizes short text)
+    if len(snippet) < 100:
+        word_count = len(snippet.split())
+        metadata_words = len(_METADATA_KEYWORDS.intersection(_WORD_RE.findall(text)))
 
         # If more than 40% of words are metadata, it's likely a TOC
         if word_count > 0 and (metadata_words / word_count) > 0.4:
             return True
 
-    return False
+    # Volume/Issue citations and TOC alerts
+    return bool(_TOC_PATTERN.search(text))
 
 
-def find_toc_signals(db):
-    """Find all TOC signals in database."""
-    signals = db.query(Signal).filter(Signal.deleted_at.is_(None)).all()
+def is_toc_signal(signal) -> bool:
+    """
+    Check if signal is a TOC notice.
 
-    toc_signals = []
-    for signal in signals:
-        if is_toc_signal(signal):
-            toc_signals.append(signal)
+    Only reads signal.entity and signal.evidence_snippet, so a Signal or a
+    query row with those columns both work.
+    """
+    return is_toc_text(signal.entity, signal.evidence_snippet)
 
-    return toc_signals
 
+def _toc_mask(rows):
+    """
+    Classify a chunk of plain (entity, evidence_snippet) tuples in a worker process.
+
+    One call per chunk keeps the per-row work to the classifier itself.
+    """
+    return [is_toc_text(entity, evidence_snippet) for entity, evidence_snippet in rows]
+
+
+def toc_candidate_filter():
+    """
+    SQL predicate that is true for every signal is_toc_signal could flag.
 
-def preview_deletions(toc_signals, limit=10):
+    Cheap server-side superset of the Python checks, so only candidate rows are
+    transferred and classified; is_toc_signal stays the final word.
+    """
+    # PostgreSQL's advanced regex syntax accepts the same pattern (\d, \s)
+    text = Signal.entity.concat(' ').concat(Signal.evidence_snippet)
+    return or_(
+        text.op('~*')(_TOC_PATTERN.pattern),
+        func.char_length(Signal.evidence_snippet) < 100,
+    )
+
+
+def find_toc_signals(db):
+    """Find the IDs of all TOC signals in database."""
+    # Classify plain (id, entity, evidence_snippet) rows streamed through a
+    # server-side cursor, one batch at a time, spread across all CPU cores
+    result = db.execute(
+        select(Signal.id, Signal.entity, Signal.evidence_snippet)
+        .where(Signal.deleted_at.is_(None), toc_candidate_filter())
+        .execution_options(yield_per=CLASSIFY_BATCH_SIZE)
+    )
+
+    toc_ids = []
+    pool = None
+    try:
+        for batch in result.partitions():
+            # Start workers only once there are candidates; spawn (not fork) so they
+            # never inherit the connection the streaming cursor is still reading from
+            if pool is None:
+                pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+            rows = [(row.entity, row.evidence_snippet) for row in batch]
+            chunks = [rows[i:i + CLASSIFY_CHUNK_SIZE] for i in range(0, len(rows), CLASSIFY_CHUNK_SIZE)]
+            hits = (hit for mask in pool.map(_toc_mask, chunks) for hit in mask)
+            toc_ids.extend(row.id for row, hit in zip(batch, hits) if hit)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return toc_ids
+
+
+def preview_deletions(db, toc_ids, limit=10):
     """Show preview of what will be deleted."""
     print(f"\n{'='*80}")
-    print(f"Found {len(toc_signals)} TOC signals to clean up")
+    print(f"Found {len(toc_ids)} TOC signals to clean up")
     print(f"{'='*80}\n")
 
-    if not toc_signals:
+    if not toc_ids:
         print("✨ No TOC signals found. Database is clean!")
         return
 
-    # Group by topic to show distribution
-    topics = {}
-    for sig in toc_signals:
-        topics[sig.topic] = topics.get(sig.topic, 0) + 1
+    # Distribution and examples come from the database; the full signals are
+    # never loaded, so a cancelled cleanup costs two small queries
+    topics = db.query(Signal.topic, func.count()).filter(
+        Signal.id == any_array(toc_ids)
+    ).group_by(Signal.topic).order_by(func.count().desc()).all()
 
     print("Distribution by topic:")
-    for topic, count in sorted(topics.items(), key=lambda x: x[1], reverse=True):
+    for topic, count in topics:
         print(f"  {topic}: {count} signals")
 
-    print(f"\nPreview (first {min(limit, len(toc_signals))} signals):")
+    examples = db.query(
+        Signal.id, Signal.entity, Signal.topic, Signal.evidence_snippet, Signal.created_at
+    ).filter(Signal.id == any_array(toc_ids)).limit(limit).all()
+
+    print(f"\nPreview (first {len(examples)} signals):")
     print("-" * 80)
 
-    for i, sig in enumerate(toc_signals[:limit], 1):
+    for i, sig in enumerate(examples, 1):
         print(f"\n{i}. ID: {sig.id}")
         print(f"   Entity: {sig.entity}")
         print(f"   Topic: {sig.topic}")
@@ -103,42 +175,55 @@ def preview_deletions(toc_signals, limit=10):
         print(f"   Created: {sig.created_at}")
 
 
-def soft_delete_signals(db, toc_signals):
-    """Soft-delete signals by setting deleted_at timestamp."""
-    now = datetime.utcnow()
-    deleted_count = 0
-
-    for signal in toc_signals:
-        signal.deleted_at = now
-        signal.notes = (signal.notes or '') + f"\n[Auto-deleted {now.strftime('%Y-%m-%d')}: TOC signal cleanup]"
-        deleted_count += 1
+# Columns recorded for each deleted signal in the audit log
+AUDIT_COLUMNS = (
+    Signal.id, Signal.entity, Signal.topic, Signal.event_type,
+    Signal.created_at, Signal.evidence_snippet, Signal.source_url,
+)
 
-    db.commit()
-    return deleted_count
 
+def soft_delete_signals(db, signal_ids):
+    """
+    Soft-delete signals by setting deleted_at timestamp.
 
-def create_audit_log(toc_signals, deleted_count):
-    """Create audit log file."""
-    log_file = Path(__file__).parent.parent / 'logs' / f'toc_cleanup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    Returns:
+        AUDIT_COLUMNS rows of the signals actually deleted (via RETURNING)
+    """
+    now = datetime.utcnow()
+    marker = f"\n[Auto-deleted {now.strftime('%Y-%m-%d')}: TOC signal cleanup]"
+    deleted = []
+
+    # One UPDATE per batch, with the note appended server-side; committing each
+    # batch keeps row locks and transaction size bounded on large cleanups.
+    # Signals deleted since the scan (e.g. by another run) are left untouched
+    for i in range(0, len(signal_ids), DELETE_BATCH_SIZE):
+        deleted.extend(db.execute(
+            update(Signal)
+            .where(
+                Signal.id == any_array(signal_ids[i:i + DELETE_BATCH_SIZE]),
+                Signal.deleted_at.is_(None),
+            )
+            .values(
+                deleted_at=now,
+                notes=func.coalesce(Signal.notes, '') + marker,
+            )
+            .returning(*AUDIT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).all())
+        db.commit()
+
+    return deleted
+
+
+def create_audit_log(deleted_rows):
+    """Create audit log file (CSV of the rows returned by soft_delete_signals)."""
+    log_file = Path(__file__).parent.parent / 'logs' / f'toc_cleanup_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
     log_file.parent.mkdir(exist_ok=True)
 
-    with open(log_file, 'w') as f:
-        f.write(f"TOC Signal Cleanup - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"{'='*80}\n\n")
-        f.write(f"Total signals deleted: {deleted_count}\n\n")
-
-        f.write("Deleted signals:\n")
-        f.write("-" * 80 + "\n")
-
-        for sig in toc_signals:
-            f.write(f"\nID: {sig.id}\n")
-            f.write(f"Entity: {sig.entity}\n")
-            f.write(f"Topic: {sig.topic}\n")
-            f.write(f"Event Type: {sig.event_type}\n")
-            f.write(f"Created: {sig.created_at}\n")
-            f.write(f"Evidence: {sig.evidence_snippet}\n")
-            f.write(f"Source: {sig.source_url}\n")
-            f.write("-" * 80 + "\n")
+    with open(log_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([column.key for column in AUDIT_COLUMNS])
+        writer.writerows(deleted_rows)
 
     return log_file
 
@@ -149,22 +234,22 @@ def main():
     print("This script will remove irrelevant journal TOC notices from the database.\n")
 
     # Connect to database
-    db = next(get_db())
+    db = SessionLocal()
 
     try:
         # Find TOC signals
         print("🔍 Scanning database for TOC signals...")
-        toc_signals = find_toc_signals(db)
+        toc_ids = find_toc_signals(db)
 
         # Show preview
-        preview_deletions(toc_signals, limit=10)
+        preview_deletions(db, toc_ids, limit=10)
 
-        if not toc_signals:
+        if not toc_ids:
             return
 
         # Confirm deletion
         print(f"\n{'='*80}")
-        print(f"⚠️  WARNING: This will soft-delete {len(toc_signals)} signals")
+        print(f"⚠️  WARNING: This will soft-delete {len(toc_ids)} signals")
         print(f"{'='*80}")
         print("\nDeleted signals will:")
         print("  - Have deleted_at timestamp set")
@@ -180,11 +265,12 @@ def main():
 
         # Perform deletion
         print("\n🗑️  Deleting TOC signals...")
-        deleted_count = soft_delete_signals(db, toc_signals)
+        deleted_rows = soft_delete_signals(db, toc_ids)
+        deleted_count = len(deleted_rows)
 
         # Create audit log
         print("📝 Creating audit log...")
-        log_file = create_audit_log(toc_signals, deleted_count)
+        log_file = create_audit_log(deleted_rows)
 
         print(f"\n✅ Cleanup complete!")
         print(f"   Deleted: {deleted_count} signals")